@@ -18,20 +18,28 @@ Usage:
     python app.py --demo   # runs with bundled sample files
 """
 
-import json
 import logging
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import click
-import google.generativeai as genai
 from dotenv import load_dotenv
 
 # ── Local imports ──────────────────────────────────────────────────────
-from src.document_loader import load_document
-from src.extractor import extract_structured_data
-from src.merger import merge_extractions
+from src import gemini_client
+from src.document_loader import (
+    iter_document_pages,
+    load_document,
+    pdf_page_count,
+)
+from src.extractor import (
+    extract_structured_data_chunked,
+    extract_structured_data_pair,
+)
+from src.merger import MergedData, merge_extractions
+from src.one_shot_merger import extract_and_merge
 from src.reasoning_engine import generate_ddr_reasoning
 from src.ddr_generator import generate_final_report
 from src.validator import validate_ddr
@@ -60,6 +68,15 @@ _DEFAULT_OUTPUT = _PROJECT_DIR / "data" / "output_ddr.txt"
 
 _SEP = "=" * 70
 
+# Documents with more text than this are streamed page by page into a
+# chunked extraction instead of being loaded whole.  A text file's size
+# on disk is its text size; a PDF's is not (images and fonts dominate,
+# and a scanned report can be megabytes of almost no text), so PDFs are
+# judged by page count instead.  At the ~3,000 characters of a typical
+# report page the two limits are about the same amount of text.
+_STREAM_THRESHOLD_BYTES = 200 * 1024
+_STREAM_THRESHOLD_PDF_PAGES = 64
+
 
 def _step(number: int, msg: str) -> None:
     """Print a pipeline step header."""
@@ -78,14 +95,23 @@ def run_pipeline(
     thermal_path: str,
     output_path: str,
     model: str = "gemini-2.0-flash-lite",
+    save_intermediate: bool = False,
+    one_shot_merge: bool = False,
 ) -> str:
     """
     Execute the full DDR pipeline and return the final report text.
 
     Steps:
         1. Load both documents.
-        2. Extract structured data from each.
-        3. Merge the two extractions.
+        2. Extract structured data from each (text files above
+           ``_STREAM_THRESHOLD_BYTES`` and PDFs above
+           ``_STREAM_THRESHOLD_PDF_PAGES`` pages are streamed page by
+           page through a chunked extraction, merging steps 1 and 2).
+        3. Merge the two extractions (and optionally save them as
+           ``merged_data.json`` next to the output, in the background).
+           With *one_shot_merge*, steps 2 and 3 are a single Gemini call
+           that returns the merged data directly; it is not used when
+           a document is streamed.
         4. Generate narrative DDR via reasoning engine.
         5. Validate the DDR against source data.
         6. Format and (optionally) save the final report.
@@ -98,46 +124,75 @@ def run_pipeline(
         print("Get a free key at: https://aistudio.google.com/apikey")
         sys.exit(1)
 
-    genai.configure(api_key=api_key)
-
-    # ── Step 1: Load documents ────────────────────────────────────
-    _step(1, "Loading documents...")
-    inspection_text = load_document(inspection_path)
-    thermal_text = load_document(thermal_path)
-    _done(
-        f"Inspection: {len(inspection_text):,} chars | "
-        f"Thermal: {len(thermal_text):,} chars"
-    )
-
-    # ── Step 2: Extract structured data ───────────────────────────
-    _step(2, "Extracting structured data from inspection report...")
-    inspection_data = extract_structured_data(
-        inspection_text, "inspection_report", model
-    )
-    _done(f"Inspection: {len(inspection_data.areas)} areas extracted.")
-
-    print(f"  [2/6] Extracting structured data from thermal report...")
-    thermal_data = extract_structured_data(
-        thermal_text, "thermal_report", model
-    )
-    _done(f"Thermal: {len(thermal_data.areas)} areas extracted.")
+    gemini_client.configure(api_key)
+
+    merged = None
+    if _is_large(inspection_path) or _is_large(thermal_path):
+        # ── Steps 1-2: Stream and extract page by page ────────────
+        # Large documents are never loaded whole: pages are grouped into
+        # chunks that are extracted while later pages are still parsing.
+        if one_shot_merge:
+            logger.warning(
+                "--one-shot-merge needs both documents loaded whole; "
+                "ignoring it for streamed large document(s)."
+            )
+        _step(1, "Large document(s) -- streaming pages into extraction...")
+        _step(2, "Extracting structured data chunk by chunk...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            insp_fut = pool.submit(
+                _extract_streamed, inspection_path, "inspection_report", model
+            )
+            therm_fut = pool.submit(
+                _extract_streamed, thermal_path, "thermal_report", model
+            )
+            inspection_data = insp_fut.result()
+            thermal_data = therm_fut.result()
+    else:
+        # ── Step 1: Load documents ────────────────────────────────
+        # The two documents are independent, so they are loaded side by side.
+        _step(1, "Loading documents...")
+        with ThreadPoolExecutor(max_workers=2) as pool:
+            insp_fut = pool.submit(load_document, inspection_path)
+            therm_fut = pool.submit(load_document, thermal_path)
+            inspection_text = insp_fut.result()
+            thermal_text = therm_fut.result()
+        _done(
+            f"Inspection: {len(inspection_text):,} chars | "
+            f"Thermal: {len(thermal_text):,} chars"
+        )
+
+        # ── Step 2: Extract structured data ───────────────────────
+        if one_shot_merge:
+            _step(2, "Extracting and merging both reports in one call...")
+            merged = extract_and_merge(inspection_text, thermal_text, model)
+        else:
+            _step(2, "Extracting structured data from both reports...")
+            inspection_data, thermal_data = extract_structured_data_pair(
+                inspection_text, thermal_text, model
+            )
 
     # ── Step 3: Merge extractions ─────────────────────────────────
-    _step(3, "Merging findings...")
-    merged = merge_extractions(inspection_data, thermal_data)
+    if merged is None:
+        _done(f"Inspection: {len(inspection_data.areas)} areas extracted.")
+        _done(f"Thermal: {len(thermal_data.areas)} areas extracted.")
+        _step(3, "Merging findings...")
+        merged = merge_extractions(inspection_data, thermal_data)
+    else:
+        _step(3, "Findings merged in step 2.")
     _done(
         f"Merged areas: {len(merged.areas)} | "
         f"Duplicate warnings: {len(merged.duplicate_warnings)} | "
-        f"Conflicts: {sum(1 for a in merged.areas if a.conflict_detected)}"
+        f"Conflicts: {merged.conflict_count}"
     )
 
-    # Save intermediate merged JSON for transparency
-    merged_json_path = Path(output_path).parent / "merged_data.json"
-    merged_json_path.write_text(
-        json.dumps(merged.model_dump(), indent=2, ensure_ascii=False),
-        encoding="utf-8",
-    )
-    _done(f"Merged data saved to: {merged_json_path}")
+    # Optionally save intermediate merged JSON for transparency.  The
+    # write runs in the background while the reasoning call is in flight.
+    save_fut = None
+    if save_intermediate:
+        merged_json_path = Path(output_path).parent / "merged_data.json"
+        save_pool = ThreadPoolExecutor(max_workers=1)
+        save_fut = save_pool.submit(_save_merged_json, merged, merged_json_path)
+        save_pool.shutdown(wait=False)
 
     # ── Step 4: Generate DDR reasoning ────────────────────────────
     _step(4, "Generating DDR narrative (this may take a moment)...")
@@ -171,10 +226,36 @@ def run_pipeline(
     print(final_report)
     print(_SEP)
     print(f"\nReport saved to: {output_path}")
+    if save_fut is not None:
+        save_fut.result()
+        print(f"Merged data saved to: {merged_json_path}")
 
     return final_report
 
 
+def _is_large(path: str) -> bool:
+    """Return True if *path* should be streamed rather than loaded whole."""
+    if Path(path).suffix.lower() == ".pdf":
+        return pdf_page_count(path) > _STREAM_THRESHOLD_PDF_PAGES
+    try:
+        return os.path.getsize(path) > _STREAM_THRESHOLD_BYTES
+    except OSError:
+        return False  # let load_document report the missing file
+
+
+def _extract_streamed(path: str, document_type: str, model: str):
+    """Extract *path* chunk by chunk straight from its page stream."""
+    return extract_structured_data_chunked(
+        iter_document_pages(path), document_type, model
+    )
+
+
+def _save_merged_json(merged: MergedData, path: Path) -> None:
+    """Write the merged data as indented JSON to *path*."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(merged.model_dump_json(indent=2).encode("utf-8"))
+
+
 # ── CLI ────────────────────────────────────────────────────────────────
 
 @click.command()
@@ -202,6 +283,20 @@ def run_pipeline(
     default=None,
     help="Gemini model to use (default: gemini-2.0-flash-lite).",
 )
+@click.option(
+    "--save-intermediate",
+    is_flag=True,
+    default=False,
+    envvar="DDR_SAVE_INTERMEDIATE",
+    help="Also write merged_data.json next to the output report.",
+)
+@click.option(
+    "--one-shot-merge",
+    is_flag=True,
+    default=False,
+    envvar="DDR_ONE_SHOT_MERGE",
+    help="Extract and merge both reports in a single Gemini call.",
+)
 @click.option(
     "--demo",
     is_flag=True,
@@ -213,6 +308,8 @@ def main(
     thermal: str | None,
     output: str | None,
     model: str | None,
+    save_intermediate: bool,
+    one_shot_merge: bool,
     demo: bool,
 ):
     """
@@ -246,7 +343,9 @@ def main(
     print(f"  Model      : {model}")
 
     try:
-        run_pipeline(inspection, thermal, output, model)
+        run_pipeline(
+            inspection, thermal, output, model, save_intermediate, one_shot_merge
+        )
     except FileNotFoundError as exc:
         print(f"\nFile Error: {exc}")
         sys.exit(1)
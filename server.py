@@ -13,15 +13,17 @@ Usage:
     uvicorn server:app --reload --port 8000
 """
 
+import asyncio
 import json
 import logging
 import os
 import sys
 import tempfile
 import shutil
+from contextlib import asynccontextmanager
 from pathlib import Path
 
-import google.generativeai as genai
+import aiofiles
 from dotenv import load_dotenv
 from fastapi import FastAPI, File, UploadFile, HTTPException
 from fastapi.middleware.cors import CORSMiddleware
@@ -30,12 +32,13 @@ from fastapi.responses import FileResponse
 from pydantic import BaseModel
 
 # ── Local imports ──────────────────────────────────────────────────────
+from src import gemini_client, llm_cache
 from src.document_loader import load_document
-from src.extractor import extract_structured_data
-from src.merger import merge_extractions
-from src.reasoning_engine import generate_ddr_reasoning
+from src.extractor import DocumentExtraction, aextract_structured_data_pair
+from src.merger import MergedData, merge_extractions
+from src.reasoning_engine import agenerate_ddr_reasoning
 from src.ddr_generator import generate_final_report
-from src.validator import validate_ddr
+from src.validator import ValidationWarning, validate_ddr
 
 # ── Setup ──────────────────────────────────────────────────────────────
 load_dotenv()
@@ -52,10 +55,35 @@ logging.basicConfig(
 logger = logging.getLogger("ai_ddr_builder.server")
 
 # ── FastAPI App ────────────────────────────────────────────────────────
+
+@asynccontextmanager
+async def lifespan(_app: FastAPI):
+    """
+    One-time startup work, so the first request does not pay for it.
+
+    The PDF backends are already imported with ``src.document_loader``;
+    the Gemini SDK is configured here once instead of on every request.
+    The response cache would keep every uploaded report's extracted
+    findings on the server's disk, so while the server runs it is off
+    unless ``DDR_CACHE_ENABLED`` turns it on.
+    """
+    api_key = os.getenv("GEMINI_API_KEY")
+    if api_key:
+        gemini_client.configure(api_key)
+    else:
+        logger.warning("GEMINI_API_KEY not set — /api/generate-ddr will fail.")
+    llm_cache.set_default_enabled(False)
+    try:
+        yield
+    finally:
+        llm_cache.set_default_enabled(True)
+
+
 app = FastAPI(
     title="AI DDR Builder API",
     description="Convert inspection & thermal reports into Detailed Diagnostic Reports.",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS — allow the Vite dev server (port 5173) and any localhost origin
@@ -77,13 +105,32 @@ if _FRONTEND_DIST.exists():
         return FileResponse(str(_FRONTEND_DIST / "index.html"))
 
 
+# Uploads are copied to disk in chunks of this size (1 MiB)
+_UPLOAD_CHUNK_SIZE = 1 << 20
+
+
 # ── Response schema ────────────────────────────────────────────────────
 
+# Fields are typed with the pipeline's own models (rather than plain
+# dicts) so the response is serialised straight from them by
+# pydantic-core, without building intermediate dicts in the handler.
+
+class ExtractedData(BaseModel):
+    inspection: DocumentExtraction
+    thermal: DocumentExtraction
+    merged: MergedData
+
+
+class ConflictInfo(BaseModel):
+    area: str
+    description: str | None
+
+
 class DDRResponse(BaseModel):
     ddr_report: str
-    extracted_data: dict
-    conflicts: list
-    validation_warnings: list
+    extracted_data: ExtractedData
+    conflicts: list[ConflictInfo]
+    validation_warnings: list[ValidationWarning]
 
 
 # ── API Endpoints ──────────────────────────────────────────────────────
@@ -108,7 +155,7 @@ async def generate_ddr(
     Accept two uploaded files (inspection + thermal), run the full
     DDR pipeline, and return the structured result.
     """
-    # ── Validate API key ──────────────────────────────────────────
+    # ── Validate API key (the SDK itself is configured at startup) ─
     api_key = os.getenv("GEMINI_API_KEY")
     if not api_key:
         raise HTTPException(
@@ -116,7 +163,6 @@ async def generate_ddr(
             detail="GEMINI_API_KEY not configured on the server. Add it to .env",
         )
 
-    genai.configure(api_key=api_key)
     model = os.getenv("GEMINI_MODEL", "gemini-2.5-flash")
 
     # ── Validate file extensions ──────────────────────────────────
@@ -132,8 +178,8 @@ async def generate_ddr(
     # ── Save uploads to temp files ────────────────────────────────
     tmp_dir = tempfile.mkdtemp(prefix="ddr_")
     try:
-        inspection_path = _save_upload(inspection_file, tmp_dir)
-        thermal_path = _save_upload(thermal_file, tmp_dir)
+        inspection_path = await _save_upload(inspection_file, tmp_dir)
+        thermal_path = await _save_upload(thermal_file, tmp_dir)
 
         logger.info(
             "Received files: %s (%s), %s (%s)",
@@ -141,10 +187,19 @@ async def generate_ddr(
             thermal_file.filename, _fmt_size(thermal_file.size),
         )
 
+        # Gemini calls go through the async client; the remaining stages
+        # are blocking (disk or CPU), so each runs in a worker thread to
+        # keep the event loop free for other requests.  The two documents
+        # are independent until the merge, so their loads run concurrently.
+
         # ── Step 1: Load documents ────────────────────────────────
+        # Uploads live in a fresh temp dir, so the loader's memo could
+        # never hit and would only keep user documents in memory.
         logger.info("[1/6] Loading documents...")
-        inspection_text = load_document(inspection_path)
-        thermal_text = load_document(thermal_path)
+        inspection_text, thermal_text = await asyncio.gather(
+            asyncio.to_thread(load_document, inspection_path, cache=False),
+            asyncio.to_thread(load_document, thermal_path, cache=False),
+        )
 
         if not inspection_text.strip():
             raise HTTPException(status_code=400, detail="Inspection file is empty or unreadable.")
@@ -152,31 +207,29 @@ async def generate_ddr(
             raise HTTPException(status_code=400, detail="Thermal file is empty or unreadable.")
 
         # ── Step 2: Extract structured data ───────────────────────
-        logger.info("[2/6] Extracting from inspection report...")
-        inspection_data = extract_structured_data(
-            inspection_text, "inspection_report", model
-        )
-
-        logger.info("[2/6] Extracting from thermal report...")
-        thermal_data = extract_structured_data(
-            thermal_text, "thermal_report", model
+        logger.info("[2/6] Extracting from inspection and thermal reports...")
+        inspection_data, thermal_data = await aextract_structured_data_pair(
+            inspection_text, thermal_text, model
         )
 
         # ── Step 3: Merge ─────────────────────────────────────────
         logger.info("[3/6] Merging findings...")
-        merged = merge_extractions(inspection_data, thermal_data)
+        merged = await asyncio.to_thread(
+            merge_extractions, inspection_data, thermal_data
+        )
 
         # ── Step 4: Reasoning ─────────────────────────────────────
         logger.info("[4/6] Generating DDR narrative...")
-        ddr_text = generate_ddr_reasoning(merged, model)
+        ddr_text = await agenerate_ddr_reasoning(merged, model)
 
         # ── Step 5: Validate ──────────────────────────────────────
         logger.info("[5/6] Validating report...")
-        validation = validate_ddr(ddr_text, merged)
+        validation = await asyncio.to_thread(validate_ddr, ddr_text, merged)
 
         # ── Step 6: Format ────────────────────────────────────────
         logger.info("[6/6] Formatting final report...")
-        final_report = generate_final_report(
+        final_report = await asyncio.to_thread(
+            generate_final_report,
             ddr_text=ddr_text,
             merged_data=merged,
             inspection_file=inspection_file.filename,
@@ -185,26 +238,17 @@ async def generate_ddr(
 
         # ── Build response ────────────────────────────────────────
         # Collect conflicts from merged areas
-        conflicts = []
-        for area in merged.areas:
-            if area.conflict_detected:
-                conflicts.append({
-                    "area": area.area_name,
-                    "description": area.conflict_description,
-                })
+        conflicts = [
+            ConflictInfo(area=area.area_name, description=area.conflict_description)
+            for area in merged.conflict_areas
+        ]
 
         # Build extracted data summary
-        extracted_data = {
-            "inspection": inspection_data.model_dump(),
-            "thermal": thermal_data.model_dump(),
-            "merged": merged.model_dump(),
-        }
-
-        # Validation warnings as list of dicts
-        validation_warnings = [
-            {"category": w.category, "detail": w.detail, "severity": w.severity}
-            for w in validation.warnings
-        ]
+        extracted_data = ExtractedData(
+            inspection=inspection_data,
+            thermal=thermal_data,
+            merged=merged,
+        )
 
         logger.info("Pipeline complete. Report: %d chars.", len(final_report))
 
@@ -212,7 +256,7 @@ async def generate_ddr(
             ddr_report=final_report,
             extracted_data=extracted_data,
             conflicts=conflicts,
-            validation_warnings=validation_warnings,
+            validation_warnings=validation.warnings,
         )
 
     except HTTPException:
@@ -227,15 +271,13 @@ async def generate_ddr(
 
 # ── Helpers ────────────────────────────────────────────────────────────
 
-def _save_upload(upload: UploadFile, directory: str) -> str:
-    """Save an uploaded file to the temp directory and return its path."""
+async def _save_upload(upload: UploadFile, directory: str) -> str:
+    """Stream an uploaded file to the temp directory and return its path."""
     filename = Path(upload.filename).name  # sanitize
     dest = os.path.join(directory, filename)
-    with open(dest, "wb") as f:
-        content = upload.file.read()
-        f.write(content)
-    # Reset file pointer in case it's needed again
-    upload.file.seek(0)
+    async with aiofiles.open(dest, "wb") as f:
+        while chunk := await upload.read(_UPLOAD_CHUNK_SIZE):
+            await f.write(chunk)
     return dest
 
 
@@ -0,0 +1,260 @@
+"""
+Context Cache Module
+====================
+Serves the static part of each Gemini prompt (system instruction plus the
+fixed instructions of a prompt template) from a Gemini explicit context
+cache, so it is uploaded and billed at the cached-token rate instead of
+being re-sent in full on every call.
+
+Responsibilities:
+    - Lazily create one ``CachedContent`` per (model, prompt hash)
+    - Recreate a cache shortly before its TTL runs out, or when Gemini
+      reports it as gone (``NotFound``)
+    - Retry cache creation periodically after a failure
+    - Fall back to a plain ``GenerativeModel`` with the full prompt when
+      caching is unavailable (unsupported model, prefix below the model's
+      minimum cacheable size, etc.)
+    - Offer the same call as a coroutine for concurrent callers
+"""
+
+import asyncio
+import hashlib
+import logging
+import threading
+import time
+from datetime import timedelta
+from typing import Any, Optional
+
+import google.generativeai as genai
+from google.api_core.exceptions import NotFound
+
+from . import gemini_client
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+_CACHE_TTL = timedelta(hours=1)
+
+# Recreate a cache this long before it expires so in-flight calls never
+# reference a cache that is about to disappear.
+_REFRESH_MARGIN_SECONDS = 60
+
+# After a failed cache creation (unsupported model, short prefix, quota,
+# network error...) full prompts are sent for this long before retrying.
+_UNAVAILABLE_RETRY_SECONDS = 600
+
+# (model, prompt hash) -> (cache, expires at).  The ``CachedContent``
+# returned by ``create`` is kept whole so binding a model to it needs no
+# lookup round trip.  A cache of None records that caching is currently
+# unavailable for that key.
+_caches: dict[
+    tuple[str, str], tuple[Optional[genai.caching.CachedContent], float]
+] = {}
+_lock = threading.Lock()
+
+# One lock per key, held while its cache is created: concurrent callers
+# for the same content wait for a single creation, while other keys (and
+# lookups of live caches) are never blocked behind the network call.
+_key_locks: dict[tuple[str, str], threading.Lock] = {}
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def generate_content(
+    model_name: str,
+    system_instruction: str,
+    static_prefix: str,
+    prompt: str,
+    generation_config: Any,
+):
+    """
+    Call Gemini with ``static_prefix + prompt`` as the user content.
+
+    The static prefix is served from a context cache when possible, in
+    which case only *prompt* is sent with the request.  Either way the
+    model is given the same instructions and input.
+
+    Returns:
+        The Gemini ``GenerateContentResponse``.
+    """
+    cache_args = (model_name, system_instruction, static_prefix)
+
+    cached_model = _get_cached_model(*cache_args)
+    if cached_model is not None:
+        try:
+            return _generate_cached(cached_model, prompt, generation_config)
+        except NotFound:
+            logger.info("Context cache for %s expired; recreating.", model_name)
+            _forget(*cache_args)
+            cached_model = _get_cached_model(*cache_args)
+            if cached_model is not None:
+                return _generate_cached(cached_model, prompt, generation_config)
+
+    model = gemini_client.get_model(model_name, system_instruction)
+    return model.generate_content(
+        static_prefix + prompt, generation_config=generation_config
+    )
+
+
+async def agenerate_content(
+    model_name: str,
+    system_instruction: str,
+    static_prefix: str,
+    prompt: str,
+    generation_config: Any,
+):
+    """
+    Async counterpart of ``generate_content``.
+
+    Requests go through ``generate_content_async`` and are capped by
+    ``gemini_client.concurrency_limit()``.  Creating a context cache and
+    binding a model to it are blocking SDK calls, so both run in a worker
+    thread.
+    """
+    cache_args = (model_name, system_instruction, static_prefix)
+
+    cached_model = await asyncio.to_thread(_get_cached_model, *cache_args)
+    if cached_model is not None:
+        try:
+            return await _agenerate_cached(cached_model, prompt, generation_config)
+        except NotFound:
+            logger.info("Context cache for %s expired; recreating.", model_name)
+            _forget(*cache_args)
+            cached_model = await asyncio.to_thread(_get_cached_model, *cache_args)
+            if cached_model is not None:
+                return await _agenerate_cached(
+                    cached_model, prompt, generation_config
+                )
+
+    model = gemini_client.get_model(model_name, system_instruction)
+    async with gemini_client.concurrency_limit():
+        return await model.generate_content_async(
+            static_prefix + prompt, generation_config=generation_config
+        )
+
+
+def split_template(template: str, marker: str) -> tuple[str, str]:
+    """
+    Split a prompt template into its static prefix and per-request part.
+
+    Everything before the first *marker* line is static; its escaped
+    braces are resolved here so it can be sent as-is.  The returned
+    per-request part still starts with *marker* and keeps its
+    ``str.format`` placeholders.
+    """
+    idx = template.index(marker)
+    return template[:idx].format(), template[idx:]
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _generate_cached(
+    model: genai.GenerativeModel, prompt: str, generation_config: Any
+):
+    """Run one request against an existing context cache."""
+    return model.generate_content(prompt, generation_config=generation_config)
+
+
+async def _agenerate_cached(
+    model: genai.GenerativeModel, prompt: str, generation_config: Any
+):
+    """Run one async request against an existing context cache."""
+    async with gemini_client.concurrency_limit():
+        return await model.generate_content_async(
+            prompt, generation_config=generation_config
+        )
+
+
+def _get_cached_model(
+    model_name: str, system_instruction: str, static_prefix: str
+) -> Optional[genai.GenerativeModel]:
+    """
+    Return a model bound to a live cache for the static content, or None.
+
+    Blocking (it may create the cache), so async callers run it in a
+    worker thread.  Binding the model to a ``CachedContent`` object makes
+    no request.
+    """
+    cache = _get_cache(model_name, system_instruction, static_prefix)
+    if cache is None:
+        return None
+    return genai.GenerativeModel.from_cached_content(cache)
+
+
+def _cache_key(
+    model_name: str, system_instruction: str, static_prefix: str
+) -> tuple[str, str]:
+    """Key a cache by model and a hash of its static content."""
+    digest = hashlib.sha256(
+        f"{system_instruction}\0{static_prefix}".encode("utf-8")
+    ).hexdigest()
+    return model_name, digest
+
+
+def _get_cache(
+    model_name: str, system_instruction: str, static_prefix: str
+) -> Optional[genai.caching.CachedContent]:
+    """Return a live cache for the static content, creating one if needed."""
+    key = _cache_key(model_name, system_instruction, static_prefix)
+    with _lock:
+        entry = _live_entry(key)
+        if entry is not None:
+            return entry[0]
+        key_lock = _key_locks.setdefault(key, threading.Lock())
+
+    with key_lock:
+        # Another caller may have created the cache while we waited.
+        with _lock:
+            entry = _live_entry(key)
+        if entry is not None:
+            return entry[0]
+
+        try:
+            cache = genai.caching.CachedContent.create(
+                model=model_name,
+                system_instruction=system_instruction,
+                contents=[static_prefix],
+                ttl=_CACHE_TTL,
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.info(
+                "Context caching unavailable for %s (%s); sending full prompts.",
+                model_name,
+                exc,
+            )
+            with _lock:
+                _caches[key] = (None, time.time() + _UNAVAILABLE_RETRY_SECONDS)
+            return None
+
+        expires_at = (
+            time.time() + _CACHE_TTL.total_seconds() - _REFRESH_MARGIN_SECONDS
+        )
+        with _lock:
+            _caches[key] = (cache, expires_at)
+        logger.info("Created context cache %s for %s.", cache.name, model_name)
+        return cache
+
+
+def _live_entry(
+    key: tuple[str, str],
+) -> Optional[tuple[Optional[genai.caching.CachedContent], float]]:
+    """Return the unexpired entry for *key*, or None (caller holds ``_lock``)."""
+    entry = _caches.get(key)
+    if entry is not None and time.time() < entry[1]:
+        return entry
+    return None
+
+
+def _forget(model_name: str, system_instruction: str, static_prefix: str) -> None:
+    """Drop the cache entry for the static content so the next call recreates it."""
+    with _lock:
+        _caches.pop(_cache_key(model_name, system_instruction, static_prefix), None)
@@ -12,6 +12,7 @@ Responsibilities:
     - Optionally write to a file
 """
 
+import io
 import logging
 from datetime import datetime, timezone
 from pathlib import Path
@@ -28,6 +29,32 @@ logger = logging.getLogger(__name__)
 _SEPARATOR = "=" * 60
 _THIN_SEP = "-" * 60
 
+_HEADER_TMPL = (
+    f"{_SEPARATOR}\n"
+    "       DETAILED DIAGNOSTIC REPORT (DDR)\n"
+    f"{_SEPARATOR}\n"
+    "\n"
+    "Generated : %(now)s\n"
+    "Source 1  : %(inspection_file)s\n"
+    "Source 2  : %(thermal_file)s\n"
+    "\n"
+    f"{_SEPARATOR}\n"
+    "\n"
+)
+
+_FOOTER = (
+    f"{_SEPARATOR}\n"
+    "                 END OF REPORT\n"
+    f"{_SEPARATOR}"
+)
+
+_CONFLICT_HEADING = f"{_THIN_SEP}\nAPPENDIX A: CONFLICT SUMMARY\n{_THIN_SEP}\n"
+_DUPLICATE_HEADING = f"{_THIN_SEP}\nAPPENDIX B: DUPLICATE DATA WARNINGS\n{_THIN_SEP}\n"
+
+# Appendix rows, filled with %-formatting once per area / warning
+_CONFLICT_ROW = "  Area: %s\n    %s\n\n"
+_DUPLICATE_ROW = "  - %s\n"
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -54,60 +81,46 @@ def generate_final_report(
     Returns:
         The complete DDR report as a formatted string.
     """
-    now = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
+    now = datetime.now(timezone.utc).isoformat(sep=" ", timespec="seconds")
 
-    parts: list[str] = []
+    buf = io.StringIO()
+    w = buf.write
 
     # --- Header ---
-    parts.append(_SEPARATOR)
-    parts.append("       DETAILED DIAGNOSTIC REPORT (DDR)")
-    parts.append(_SEPARATOR)
-    parts.append("")
-    parts.append(f"Generated : {now}")
-    parts.append(f"Source 1  : {inspection_file}")
-    parts.append(f"Source 2  : {thermal_file}")
-    parts.append("")
-    parts.append(_SEPARATOR)
-    parts.append("")
+    w(_HEADER_TMPL % {
+        "now": now,
+        "inspection_file": inspection_file,
+        "thermal_file": thermal_file,
+    })
 
     # --- Main DDR body ---
-    parts.append(ddr_text)
-    parts.append("")
+    w(ddr_text)
+    w("\n\n")
 
     # --- Appendix: Conflict Summary ---
-    conflicts = [
-        area for area in merged_data.areas if area.conflict_detected
-    ]
+    conflicts = merged_data.conflict_areas
     if conflicts:
-        parts.append(_THIN_SEP)
-        parts.append("APPENDIX A: CONFLICT SUMMARY")
-        parts.append(_THIN_SEP)
+        w(_CONFLICT_HEADING)
         for area in conflicts:
-            parts.append(f"  Area: {area.area_name}")
-            parts.append(f"    {area.conflict_description}")
-            parts.append("")
+            w(_CONFLICT_ROW % (area.area_name, area.conflict_description))
 
     # --- Appendix: Duplicate Warnings ---
     if merged_data.duplicate_warnings:
-        parts.append(_THIN_SEP)
-        parts.append("APPENDIX B: DUPLICATE DATA WARNINGS")
-        parts.append(_THIN_SEP)
+        w(_DUPLICATE_HEADING)
         for warning in merged_data.duplicate_warnings:
-            parts.append(f"  - {warning}")
-        parts.append("")
+            w(_DUPLICATE_ROW % warning)
+        w("\n")
 
     # --- Footer ---
-    parts.append(_SEPARATOR)
-    parts.append("                 END OF REPORT")
-    parts.append(_SEPARATOR)
+    w(_FOOTER)
 
-    report = "\n".join(parts)
+    report = buf.getvalue()
 
     # Optionally persist to file
     if output_path:
         out = Path(output_path)
         out.parent.mkdir(parents=True, exist_ok=True)
-        out.write_text(report, encoding="utf-8")
+        out.write_bytes(report.encode("utf-8"))
         logger.info("Report written to %s", out)
 
     logger.info("Final DDR report generated (%d chars).", len(report))
@@ -5,28 +5,88 @@ Accepts PDF or plain-text files and returns clean raw text.
 
 Responsibilities:
     - Detect file type (PDF vs TXT)
-    - Extract text from PDFs using pdfplumber (fallback: PyPDF2)
+    - Extract text from PDFs using PyMuPDF (fallback: pdfplumber, then
+      PyPDF2), parsing larger documents with pdfplumber in a shared pool
+      of worker processes
     - Read plain-text files directly
-    - Return the full document text as a string
+    - Memoise loaded text per (path, mtime, size) for the process lifetime
+    - Return the full document text as a string, or stream it page by
+      page for large documents
 
 No business logic lives here — this is purely I/O.
 """
 
+import codecs
 import logging
+import multiprocessing
 import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import (
+    ProcessPoolExecutor,
+    ThreadPoolExecutor,
+    as_completed,
+    wait,
+)
+from concurrent.futures.process import BrokenProcessPool
+from itertools import repeat
 from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional
+
+# Optional PDF backends are imported once here so the hot loader path is
+# a plain attribute check instead of an import statement per call.
+try:
+    import pymupdf
+except ImportError:  # pragma: no cover — optional dependency
+    pymupdf = None
+
+try:
+    import pdfplumber
+except ImportError:  # pragma: no cover — optional dependency
+    pdfplumber = None
+
+try:
+    from PyPDF2 import PdfReader
+except ImportError:  # pragma: no cover — optional dependency
+    PdfReader = None
 
 logger = logging.getLogger(__name__)
 
+# PDFs with fewer pages are parsed serially — handing the pages to worker
+# processes costs more than it saves.  This applies to pdfplumber only.
+_PARALLEL_MIN_PAGES = 16
+
+# Shared worker-process pool for page-parallel parsing (see below)
+_process_pool: Optional[ProcessPoolExecutor] = None
+_process_pool_lock = threading.Lock()
+
+# Seconds pdfplumber (the preferred fallback backend) gets before a PyPDF2
+# result is accepted instead.
+_PREFERRED_BACKEND_GRACE = 2.0
 
-def load_document(file_path: str) -> str:
+# Text files above this size are decoded incrementally in chunks.
+_LARGE_TXT_BYTES = 1 << 20
+_TXT_CHUNK_SIZE = 1 << 20
+
+# Process-wide LRU of loaded documents: (resolved path, mtime_ns, size) ->
+# text.  A modified file gets a new key, so stale entries are never served.
+_LOAD_CACHE_SIZE = 32
+_load_cache: "OrderedDict[tuple[str, int, int], str]" = OrderedDict()
+_load_cache_lock = threading.Lock()
+
+
+def load_document(file_path: str, cache: bool = True) -> str:
     """
     Load a document from *file_path* and return its text content.
 
     Supported formats:
-        - .pdf  → extracted via pdfplumber (with PyPDF2 fallback)
+        - .pdf  → extracted via PyMuPDF (with pdfplumber / PyPDF2 fallback)
         - .txt  → read directly as UTF-8 text
 
+    Repeat loads of an unchanged file are served from an in-process cache.
+    Pass ``cache=False`` for one-off files (e.g. uploads in a temporary
+    directory) so their text is neither looked up nor kept in memory.
+
     Raises:
         FileNotFoundError: if the path does not exist.
         ValueError:        if the extension is unsupported.
@@ -36,56 +96,188 @@ def load_document(file_path: str) -> str:
     """
     path = Path(file_path)
 
+    try:
+        stat = path.stat()
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Document not found: {file_path}") from None
+
+    if not cache:
+        return _load_uncached(path)
+
+    key = (str(path.resolve()), stat.st_mtime_ns, stat.st_size)
+    with _load_cache_lock:
+        text = _load_cache.get(key)
+        if text is not None:
+            _load_cache.move_to_end(key)
+            logger.info("Loading document: %s (cached)", path.name)
+            return text
+
+    text = _load_uncached(path)
+
+    with _load_cache_lock:
+        _load_cache[key] = text
+        _load_cache.move_to_end(key)
+        while len(_load_cache) > _LOAD_CACHE_SIZE:
+            _load_cache.popitem(last=False)
+    return text
+
+
+def iter_document_pages(file_path: str) -> Iterator[str]:
+    """
+    Yield the text of the document at *file_path* one page at a time.
+
+    Unlike ``load_document`` the full text is never held in memory, so a
+    caller can start working on early pages while later ones are still
+    being parsed.  PDF pages come from the first backend that yields any
+    text (PyMuPDF, pdfplumber, then PyPDF2); plain-text files have no pages
+    and are yielded one paragraph (blank-line separated block) at a time.
+    Empty pages are skipped.
+
+    Raises:
+        FileNotFoundError: if the path does not exist.
+        ValueError:        if the extension is unsupported.
+    """
+    path = Path(file_path)
+
     if not path.exists():
         raise FileNotFoundError(f"Document not found: {file_path}")
 
     ext = path.suffix.lower()
-    logger.info("Loading document: %s (type: %s)", path.name, ext)
+    logger.info("Streaming document: %s (type: %s)", path.name, ext)
 
     if ext == ".pdf":
-        return _extract_pdf_text(path)
+        pages = _iter_pdf_pages(path)
     elif ext == ".txt":
-        return _extract_txt_text(path)
+        pages = _iter_txt_paragraphs(path)
     else:
         raise ValueError(
             f"Unsupported file type '{ext}'. Supported types: .pdf, .txt"
         )
+    return (text for text in map(str.strip, pages) if text)
+
+
+def pdf_page_count(file_path: str) -> int:
+    """
+    Return the number of pages in the PDF at *file_path*.
+
+    Only the document's page tree is read, not its text, so this is cheap
+    enough to decide how a document should be loaded.  Returns 0 if no
+    PDF backend is installed or the file cannot be opened.
+    """
+    return _pdf_page_count(Path(file_path))
 
 
 # ---------------------------------------------------------------------------
 # Private helpers
 # ---------------------------------------------------------------------------
 
+def _load_uncached(path: Path) -> str:
+    """Dispatch on the file extension and extract the text of *path*."""
+    ext = path.suffix.lower()
+    logger.info("Loading document: %s (type: %s)", path.name, ext)
+
+    if ext == ".pdf":
+        return _extract_pdf_text(path)
+    elif ext == ".txt":
+        return _extract_txt_text(path)
+    else:
+        raise ValueError(
+            f"Unsupported file type '{ext}'. Supported types: .pdf, .txt"
+        )
+
+
 def _extract_pdf_text(path: Path) -> str:
-    """Extract text from a PDF file using pdfplumber, falling back to PyPDF2."""
-    text = _try_pdfplumber(path)
-    if text and text.strip():
-        return text.strip()
+    """
+    Extract text from a PDF.
 
-    logger.warning("pdfplumber returned empty text; falling back to PyPDF2.")
-    text = _try_pypdf2(path)
+    PyMuPDF (MuPDF, native code) is tried first — it is several times
+    faster than the pure-Python backends.  If it is missing or finds no
+    text, a large document is parsed with pdfplumber page-parallel in the
+    shared worker-process pool, then PyPDF2 if that finds nothing.
+    A small one races pdfplumber against PyPDF2 instead: both start at
+    once so a bad PDF does not pay for two full sequential passes.
+    pdfplumber keeps layout better, so it gets a short head start; after
+    that the first backend with non-empty text wins and the other is
+    abandoned.  The race backends always run serially, so an abandoned
+    one never holds worker processes.
+    """
+    text = _try_pymupdf(path)
     if text and text.strip():
         return text.strip()
+    if pymupdf is not None:
+        logger.warning("PyMuPDF returned empty text; falling back to pdfplumber.")
+
+    if pdfplumber is not None:
+        page_count = _pdf_page_count(path)
+        if _use_parallel_pages(page_count):
+            text = _try_pdfplumber_parallel(path, page_count)
+            if text and text.strip():
+                return text.strip()
+            logger.warning("pdfplumber returned empty text; falling back to PyPDF2.")
+            text = _try_pypdf2(path)
+            if text and text.strip():
+                return text.strip()
+            logger.error("Could not extract text from PDF: %s", path.name)
+            return ""
+
+    pool = ThreadPoolExecutor(max_workers=2)
+    try:
+        plumber_fut = pool.submit(_try_pdfplumber, path)
+        pypdf_fut = pool.submit(_try_pypdf2, path)
+
+        done, _ = wait([plumber_fut], timeout=_PREFERRED_BACKEND_GRACE)
+        if done:
+            text = plumber_fut.result()
+            if text and text.strip():
+                return text.strip()
+            logger.warning("pdfplumber returned empty text; falling back to PyPDF2.")
+
+        for fut in as_completed([plumber_fut, pypdf_fut]):
+            text = fut.result()
+            if text and text.strip():
+                return text.strip()
+    finally:
+        # Best-effort: a backend that is already running cannot be stopped,
+        # but we no longer wait for it.
+        pool.shutdown(wait=False, cancel_futures=True)
 
     logger.error("Could not extract text from PDF: %s", path.name)
     return ""
 
 
+def _try_pymupdf(path: Path) -> str:
+    """Attempt extraction with PyMuPDF."""
+    if pymupdf is None:
+        return ""
+    try:
+        # Always serial: MuPDF reads a page in well under a millisecond,
+        # far less than starting worker processes would cost.
+        with pymupdf.open(str(path)) as doc:
+            return _join_pages(page.get_text("text") for page in doc)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("PyMuPDF failed: %s", exc)
+        return ""
+
+
 def _try_pdfplumber(path: Path) -> str:
     """Attempt extraction with pdfplumber."""
+    if pdfplumber is None:
+        logger.warning("pdfplumber is not installed; skipping.")
+        return ""
     try:
-        import pdfplumber
-
-        pages: list[str] = []
         with pdfplumber.open(str(path)) as pdf:
-            for page in pdf.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    pages.append(page_text)
-        return "\n\n".join(pages)
-    except ImportError:
-        logger.warning("pdfplumber is not installed; skipping.")
+            return _join_pages(page.extract_text() for page in pdf.pages)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("pdfplumber failed: %s", exc)
         return ""
+
+
+def _try_pdfplumber_parallel(path: Path, page_count: int) -> str:
+    """Attempt extraction with pdfplumber, page ranges in worker processes."""
+    try:
+        return _join_pages(
+            _map_page_ranges(_pdfplumber_page_range, path, page_count)
+        )
     except Exception as exc:  # noqa: BLE001
         logger.warning("pdfplumber failed: %s", exc)
         return ""
@@ -93,28 +285,253 @@ def _try_pdfplumber(path: Path) -> str:
 
 def _try_pypdf2(path: Path) -> str:
     """Attempt extraction with PyPDF2."""
-    try:
-        from PyPDF2 import PdfReader
-
-        reader = PdfReader(str(path))
-        pages: list[str] = []
-        for page in reader.pages:
-            page_text = page.extract_text()
-            if page_text:
-                pages.append(page_text)
-        return "\n\n".join(pages)
-    except ImportError:
+    if PdfReader is None:
         logger.warning("PyPDF2 is not installed; skipping.")
         return ""
+    try:
+        reader = PdfReader(str(path))
+        return _join_pages(page.extract_text() for page in reader.pages)
     except Exception as exc:  # noqa: BLE001
         logger.warning("PyPDF2 failed: %s", exc)
         return ""
 
 
+def _pdf_page_count(path: Path) -> int:
+    """Return the page count of *path* from the cheapest backend (0 on error)."""
+    try:
+        if pymupdf is not None:
+            with pymupdf.open(str(path)) as doc:
+                return doc.page_count
+        if PdfReader is not None:
+            return len(PdfReader(str(path)).pages)
+        if pdfplumber is not None:
+            with pdfplumber.open(str(path)) as pdf:
+                return len(pdf.pages)
+    except Exception as exc:  # noqa: BLE001
+        logger.warning("Could not count pages of %s: %s", path.name, exc)
+    return 0
+
+
+# ---------------------------------------------------------------------------
+# Page-parallel PDF extraction
+# ---------------------------------------------------------------------------
+# pdfplumber is pure Python and holds the GIL while laying out a page, so
+# the pages of a large document are split into contiguous ranges and
+# parsed in worker processes.  PyMuPDF is fast enough that it is never
+# parallelised, and PyPDF2 is only a last resort.  Each worker re-opens
+# the PDF itself — page objects are tied to an open file handle and
+# cannot be pickled.
+#
+# One pool is shared by the whole process and created on first use.  It
+# uses the "spawn" start method: documents are loaded from worker threads
+# (the CLI loader pool, ``asyncio.to_thread`` in the server), and forking
+# a multithreaded process can deadlock the child.
+
+
+def _use_parallel_pages(page_count: int) -> bool:
+    """Return True if a document is large enough to parse in parallel."""
+    return page_count >= _PARALLEL_MIN_PAGES and _available_cpus() > 1
+
+
+def _available_cpus() -> int:
+    """Return the number of CPUs this process may run on."""
+    try:
+        return len(os.sched_getaffinity(0))
+    except AttributeError:  # not available on macOS / Windows
+        return os.cpu_count() or 1
+
+
+def _get_process_pool() -> ProcessPoolExecutor:
+    """Return the shared page-parsing pool, creating it on first use."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is None:
+            _process_pool = ProcessPoolExecutor(
+                max_workers=_available_cpus(),
+                mp_context=multiprocessing.get_context("spawn"),
+            )
+        return _process_pool
+
+
+def _discard_process_pool(pool: ProcessPoolExecutor) -> None:
+    """Drop *pool* after a worker died, so the next call starts a new one."""
+    global _process_pool
+    with _process_pool_lock:
+        if _process_pool is pool:
+            _process_pool = None
+    pool.shutdown(wait=False, cancel_futures=True)
+
+
+def _map_page_ranges(
+    worker: Callable[[str, int, int], list[str]],
+    path: Path,
+    page_count: int,
+) -> list[str]:
+    """Run *worker* over contiguous page ranges and return texts in order."""
+    workers = min(_available_cpus(), page_count)
+    step = -(-page_count // workers)  # ceiling division
+    starts = list(range(0, page_count, step))
+    stops = [min(start + step, page_count) for start in starts]
+
+    pool = _get_process_pool()
+    try:
+        chunks = list(pool.map(worker, repeat(str(path)), starts, stops))
+    except BrokenProcessPool:
+        _discard_process_pool(pool)
+        raise
+    return [text for chunk in chunks for text in chunk]
+
+
+def _pdfplumber_page_range(path: str, start: int, stop: int) -> list[str]:
+    """Extract pages ``start:stop`` with pdfplumber (runs in a worker)."""
+    with pdfplumber.open(path) as pdf:
+        return [pdf.pages[i].extract_text() or "" for i in range(start, stop)]
+
+
+def _join_pages(page_texts: Iterable[Optional[str]]) -> str:
+    """Join non-empty page texts with blank lines between pages."""
+    return "\n\n".join(text for text in page_texts if text)
+
+
+# ---------------------------------------------------------------------------
+# Page streaming
+# ---------------------------------------------------------------------------
+
+
+def _iter_pdf_pages(path: Path) -> Iterator[str]:
+    """
+    Yield raw page texts, falling back through the backends like
+    ``_extract_pdf_text`` does (PyMuPDF, pdfplumber, then PyPDF2).
+
+    A backend that fails or yields only empty pages hands over to the
+    next one.  Once a backend has yielded text the caller may already
+    have consumed it, so a later failure is raised instead of restarting
+    the document with another backend.
+    """
+    backends = [
+        (name, pages)
+        for name, installed, pages in (
+            ("PyMuPDF", pymupdf is not None, _pymupdf_pages),
+            ("pdfplumber", pdfplumber is not None, _pdfplumber_pages),
+            ("PyPDF2", PdfReader is not None, _pypdf2_pages),
+        )
+        if installed
+    ]
+    if not backends:
+        logger.error("No PDF backend installed; cannot read %s", path.name)
+        return
+
+    for name, pages in backends:
+        found_text = False
+        try:
+            for text in pages(path):
+                if text and text.strip():
+                    found_text = True
+                yield text
+        except Exception as exc:  # noqa: BLE001
+            if found_text:
+                raise
+            logger.warning("%s failed: %s", name, exc)
+            continue
+        if found_text:
+            return
+        logger.warning("%s returned empty text; trying the next backend.", name)
+
+    logger.error("Could not extract text from PDF: %s", path.name)
+
+
+def _pymupdf_pages(path: Path) -> Iterator[str]:
+    """Yield page texts with PyMuPDF."""
+    with pymupdf.open(str(path)) as doc:
+        for page in doc:
+            yield page.get_text("text")
+
+
+def _pdfplumber_pages(path: Path) -> Iterator[str]:
+    """Yield page texts with pdfplumber."""
+    with pdfplumber.open(str(path)) as pdf:
+        for page in pdf.pages:
+            yield page.extract_text() or ""
+            page.close()  # drop the page's cached layout objects
+
+
+def _pypdf2_pages(path: Path) -> Iterator[str]:
+    """Yield page texts with PyPDF2."""
+    for page in PdfReader(str(path)).pages:
+        yield page.extract_text() or ""
+
+
+def _iter_txt_paragraphs(path: Path) -> Iterator[str]:
+    """Yield blank-line separated blocks of a text file."""
+    with open(path, encoding=_detect_txt_encoding(path)) as f:
+        block: list[str] = []
+        for line in f:
+            if line.strip():
+                block.append(line)
+            elif block:
+                yield "".join(block)
+                block = []
+        if block:
+            yield "".join(block)
+
+
+def _detect_txt_encoding(path: Path) -> str:
+    """Return ``"utf-8"`` if *path* decodes as UTF-8, else ``"latin-1"``."""
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    try:
+        with open(path, "rb") as f:
+            while chunk := f.read(_TXT_CHUNK_SIZE):
+                decoder.decode(chunk)
+        decoder.decode(b"", final=True)
+    except UnicodeDecodeError:
+        logger.warning("UTF-8 decode failed; trying latin-1.")
+        return "latin-1"
+    return "utf-8"
+
+
+# ---------------------------------------------------------------------------
+# Plain-text files
+# ---------------------------------------------------------------------------
+
+
 def _extract_txt_text(path: Path) -> str:
-    """Read a plain-text file."""
+    """Read a plain-text file as UTF-8, falling back to latin-1."""
+    if path.stat().st_size > _LARGE_TXT_BYTES:
+        return _read_large_txt(path).strip()
+
+    # Read the bytes once; a failed UTF-8 decode is retried in memory.
+    data = path.read_bytes()
     try:
-        return path.read_text(encoding="utf-8").strip()
+        return data.decode("utf-8").strip()
     except UnicodeDecodeError:
         logger.warning("UTF-8 decode failed; trying latin-1.")
-        return path.read_text(encoding="latin-1").strip()
+        return data.decode("latin-1").strip()
+
+
+def _read_large_txt(path: Path) -> str:
+    """
+    Decode a large text file chunk by chunk.
+
+    Only one raw chunk is held at a time instead of a full bytes copy of
+    the file next to the decoded text.  The file is re-read as latin-1
+    only if it turns out not to be valid UTF-8.
+    """
+    try:
+        return _decode_chunked(path, "utf-8")
+    except UnicodeDecodeError:
+        logger.warning("UTF-8 decode failed; trying latin-1.")
+        return _decode_chunked(path, "latin-1")
+
+
+def _decode_chunked(path: Path, encoding: str) -> str:
+    """Read *path* in fixed-size chunks with an incremental decoder."""
+    decoder = codecs.getincrementaldecoder(encoding)()
+    pieces: list[str] = []
+    fd = os.open(path, os.O_RDONLY | getattr(os, "O_BINARY", 0))
+    try:
+        while chunk := os.read(fd, _TXT_CHUNK_SIZE):
+            pieces.append(decoder.decode(chunk))
+        pieces.append(decoder.decode(b"", final=True))
+    finally:
+        os.close(fd)
+    return "".join(pieces)
@@ -6,22 +6,38 @@ and returns a validated Pydantic model of the extracted data.
 
 Responsibilities:
     - Load the extraction prompt template
-    - Call the LLM (Google Gemini) with the document text
+    - Call the LLM (Google Gemini) with the document text — one document
+      at a time, or an inspection + thermal pair in a single call — with
+      blocking or async (``a``-prefixed) entry points
+    - Extract batches of documents concurrently (bounded by
+      ``GEMINI_MAX_CONCURRENCY``)
+    - Map-reduce long documents: extract page chunks in parallel while
+      later pages are still being parsed, then combine the results
     - Parse the JSON response into Pydantic models
+    - Reuse cached responses for previously seen documents
     - Handle and log extraction errors gracefully
 """
 
+import asyncio
+import functools
 import json
 import logging
+import re
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Optional
+from typing import Iterable, Iterator, Optional, TypeVar
 
 import google.generativeai as genai
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, ValidationError
+from pydantic_core import from_json
+
+from . import context_cache, gemini_client, llm_cache
 
 logger = logging.getLogger(__name__)
 
+ModelT = TypeVar("ModelT", bound=BaseModel)
+
 # ---------------------------------------------------------------------------
 # Pydantic schemas — these enforce the structure we expect from the LLM
 # ---------------------------------------------------------------------------
@@ -77,21 +93,60 @@ class DocumentExtraction(BaseModel):
             self.global_notes = []
 
 
+class PairExtraction(BaseModel):
+    """Extraction results for an inspection + thermal report pair."""
+
+    inspection: DocumentExtraction = Field(
+        default_factory=DocumentExtraction,
+        description="Extraction for the inspection report",
+    )
+    thermal: DocumentExtraction = Field(
+        default_factory=DocumentExtraction,
+        description="Extraction for the thermal report",
+    )
+
+
 # ---------------------------------------------------------------------------
 # Prompt loader
 # ---------------------------------------------------------------------------
 
 _PROMPT_DIR = Path(__file__).resolve().parent.parent / "prompts"
 
+# First line of the per-document section of each template; everything
+# above it is static and is served from a Gemini context cache.
+_EXTRACTION_REQUEST_MARKER = "=== DOCUMENT TYPE ==="
+_PAIR_REQUEST_MARKER = "=== INSPECTION REPORT TEXT ==="
 
+# Chunked extraction: upper bound on the characters of page text sent per
+# call, and how many chunk calls may be in flight at once.
+_CHUNK_MAX_CHARS = 50_000
+_CHUNK_WORKERS = 4
+
+_SYSTEM_INSTRUCTION = (
+    "You are a precise data-extraction assistant. "
+    "Return ONLY valid JSON with no additional text. "
+    "Keep responses concise — use short descriptions."
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _load_extraction_prompt() -> str:
-    """Load the extraction prompt template from disk."""
+    """Load the extraction prompt template from disk (once per process)."""
     prompt_path = _PROMPT_DIR / "extraction_prompt.txt"
     if not prompt_path.exists():
         raise FileNotFoundError(f"Extraction prompt not found at {prompt_path}")
     return prompt_path.read_text(encoding="utf-8")
 
 
+@functools.lru_cache(maxsize=1)
+def _load_pair_extraction_prompt() -> str:
+    """Load the two-document extraction prompt template from disk (once per process)."""
+    prompt_path = _PROMPT_DIR / "pair_extraction_prompt.txt"
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Pair extraction prompt not found at {prompt_path}")
+    return prompt_path.read_text(encoding="utf-8")
+
+
 # ---------------------------------------------------------------------------
 # Main extraction function
 # ---------------------------------------------------------------------------
@@ -117,40 +172,75 @@ def extract_structured_data(
         logger.warning("Empty document text provided — returning empty extraction.")
         return DocumentExtraction(areas=[], global_notes=[])
 
-    # Build the prompt by filling in placeholders
-    prompt_template = _load_extraction_prompt()
-    prompt = prompt_template.format(
-        document_type=document_type,
-        document_text=document_text,
-    )
+    static_prefix, prompt = _build_extraction_prompt(document_text, document_type)
 
-    logger.info(
-        "Sending extraction request to %s (doc_type=%s, text_len=%d)",
-        model_name,
-        document_type,
-        len(document_text),
-    )
+    cached = llm_cache.get(model_name, document_type, static_prefix + prompt)
+    if cached is not None:
+        return DocumentExtraction.model_validate_json(cached)
+
+    _log_extraction_request(model_name, document_type, document_text)
 
     try:
-        raw_content = _call_gemini_extract(model_name, prompt)
+        raw_content = _call_gemini_extract(
+            model_name, static_prefix, prompt, response_schema=DocumentExtraction
+        )
+        extraction, complete = _parse_extraction(raw_content)
+        if complete:
+            llm_cache.put(
+                model_name,
+                document_type,
+                static_prefix + prompt,
+                extraction.model_dump_json(),
+            )
+        return extraction
+
+    except json.JSONDecodeError as exc:
+        logger.error("LLM returned invalid JSON: %s", exc)
+        raise ValueError(f"Extraction failed — invalid JSON from LLM: {exc}") from exc
+    except Exception as exc:
+        logger.error("Extraction failed: %s", exc)
+        raise
+
 
-        logger.debug("Raw LLM response (first 500 chars): %s", raw_content[:500])
+async def aextract_structured_data(
+    document_text: str,
+    document_type: str,
+    model_name: str = "gemini-2.0-flash",
+) -> DocumentExtraction:
+    """
+    Async counterpart of ``extract_structured_data``.
+
+    Many documents can be extracted concurrently with ``asyncio.gather``;
+    the number of requests in flight is capped by
+    ``GEMINI_MAX_CONCURRENCY``.
+    """
+    if not document_text.strip():
+        logger.warning("Empty document text provided — returning empty extraction.")
+        return DocumentExtraction(areas=[], global_notes=[])
 
-        # Clean potential markdown fences the model may add despite instructions
-        raw_content = _strip_json_fences(raw_content)
+    static_prefix, prompt = _build_extraction_prompt(document_text, document_type)
 
-        # Attempt to repair truncated JSON before parsing
-        raw_content = _repair_truncated_json(raw_content)
+    cached = await asyncio.to_thread(
+        llm_cache.get, model_name, document_type, static_prefix + prompt
+    )
+    if cached is not None:
+        return DocumentExtraction.model_validate_json(cached)
 
-        # Parse JSON and validate with Pydantic
-        data = json.loads(raw_content)
-        extraction = DocumentExtraction.model_validate(data)
+    _log_extraction_request(model_name, document_type, document_text)
 
-        logger.info(
-            "Extraction complete — %d areas, %d global notes.",
-            len(extraction.areas),
-            len(extraction.global_notes),
+    try:
+        raw_content = await _acall_gemini_extract(
+            model_name, static_prefix, prompt, response_schema=DocumentExtraction
         )
+        extraction, complete = _parse_extraction(raw_content)
+        if complete:
+            await asyncio.to_thread(
+                llm_cache.put,
+                model_name,
+                document_type,
+                static_prefix + prompt,
+                extraction.model_dump_json(),
+            )
         return extraction
 
     except json.JSONDecodeError as exc:
@@ -161,53 +251,422 @@ def extract_structured_data(
         raise
 
 
-def _call_gemini_extract(model_name: str, prompt: str) -> str:
-    """Call Gemini with retry logic for rate-limits and truncation."""
+def extract_structured_data_pair(
+    inspection_text: str,
+    thermal_text: str,
+    model_name: str = "gemini-2.0-flash",
+) -> tuple[DocumentExtraction, DocumentExtraction]:
+    """
+    Extract both reports of a pair with a single Gemini call.
+
+    Sending the two documents together saves one network round-trip and
+    one pass over the shared instructions compared to two
+    ``extract_structured_data`` calls.  If one of the documents is empty,
+    only the other one is sent (via the single-document path).
+
+    Parameters:
+        inspection_text: Raw text of the inspection report.
+        thermal_text:    Raw text of the thermal report.
+        model_name:      The Gemini model name to use for extraction.
+
+    Returns:
+        ``(inspection_extraction, thermal_extraction)``
+    """
+    if not inspection_text.strip() or not thermal_text.strip():
+        return (
+            extract_structured_data(inspection_text, "inspection_report", model_name),
+            extract_structured_data(thermal_text, "thermal_report", model_name),
+        )
+
+    static_prefix, prompt = _build_pair_prompt(inspection_text, thermal_text)
+
+    cached = llm_cache.get(model_name, "pair_extraction", static_prefix + prompt)
+    if cached is not None:
+        pair = PairExtraction.model_validate_json(cached)
+        return pair.inspection, pair.thermal
+
+    _log_pair_request(model_name, inspection_text, thermal_text)
+
+    try:
+        raw_content = _call_gemini_extract(
+            model_name, static_prefix, prompt, response_schema=PairExtraction
+        )
+        pair, complete = _parse_pair(raw_content)
+        if complete:
+            llm_cache.put(
+                model_name,
+                "pair_extraction",
+                static_prefix + prompt,
+                pair.model_dump_json(),
+            )
+        return pair.inspection, pair.thermal
+
+    except json.JSONDecodeError as exc:
+        logger.error("LLM returned invalid JSON: %s", exc)
+        raise ValueError(f"Extraction failed — invalid JSON from LLM: {exc}") from exc
+    except Exception as exc:
+        logger.error("Pair extraction failed: %s", exc)
+        raise
+
+
+async def aextract_structured_data_pair(
+    inspection_text: str,
+    thermal_text: str,
+    model_name: str = "gemini-2.0-flash",
+) -> tuple[DocumentExtraction, DocumentExtraction]:
+    """
+    Async counterpart of ``extract_structured_data_pair``.
+
+    If one of the documents is empty, the two single-document
+    extractions run concurrently instead.
+    """
+    if not inspection_text.strip() or not thermal_text.strip():
+        inspection, thermal = await asyncio.gather(
+            aextract_structured_data(inspection_text, "inspection_report", model_name),
+            aextract_structured_data(thermal_text, "thermal_report", model_name),
+        )
+        return inspection, thermal
+
+    static_prefix, prompt = _build_pair_prompt(inspection_text, thermal_text)
+
+    cached = await asyncio.to_thread(
+        llm_cache.get, model_name, "pair_extraction", static_prefix + prompt
+    )
+    if cached is not None:
+        pair = PairExtraction.model_validate_json(cached)
+        return pair.inspection, pair.thermal
+
+    _log_pair_request(model_name, inspection_text, thermal_text)
+
+    try:
+        raw_content = await _acall_gemini_extract(
+            model_name, static_prefix, prompt, response_schema=PairExtraction
+        )
+        pair, complete = _parse_pair(raw_content)
+        if complete:
+            await asyncio.to_thread(
+                llm_cache.put,
+                model_name,
+                "pair_extraction",
+                static_prefix + prompt,
+                pair.model_dump_json(),
+            )
+        return pair.inspection, pair.thermal
+
+    except json.JSONDecodeError as exc:
+        logger.error("LLM returned invalid JSON: %s", exc)
+        raise ValueError(f"Extraction failed — invalid JSON from LLM: {exc}") from exc
+    except Exception as exc:
+        logger.error("Pair extraction failed: %s", exc)
+        raise
+
+
+def extract_structured_data_batch(
+    documents: list[tuple[str, str]],
+    model_name: str = "gemini-2.0-flash",
+) -> list[DocumentExtraction]:
+    """
+    Extract many documents at once (e.g. a backfill of report pairs).
+
+    Documents are extracted concurrently in a thread pool of
+    ``GEMINI_MAX_CONCURRENCY`` workers; from async code use
+    ``aextract_structured_data_batch`` instead.  No event loop is
+    started here: the SDK's async client stays bound to the first loop
+    that uses it, so a loop per call would break every later batch.
+
+    Parameters:
+        documents:  ``(document_text, document_type)`` tuples.
+        model_name: The Gemini model name to use for extraction.
+
+    Returns:
+        One ``DocumentExtraction`` per document, in input order.
+    """
+    logger.info("Extracting batch of %d documents with %s", len(documents), model_name)
+    if not documents:
+        return []
+    workers = min(gemini_client.max_concurrency(), len(documents))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [
+            pool.submit(extract_structured_data, text, document_type, model_name)
+            for text, document_type in documents
+        ]
+        return [fut.result() for fut in futures]
+
+
+async def aextract_structured_data_batch(
+    documents: list[tuple[str, str]],
+    model_name: str = "gemini-2.0-flash",
+) -> list[DocumentExtraction]:
+    """
+    Async counterpart of ``extract_structured_data_batch``.
+
+    All documents are submitted concurrently; at most
+    ``GEMINI_MAX_CONCURRENCY`` requests are in flight at a time, and
+    rate-limited requests back off and retry individually.  Documents
+    already in the response cache are not sent.
+    """
+    logger.info("Extracting batch of %d documents with %s", len(documents), model_name)
+    return list(
+        await asyncio.gather(
+            *(
+                aextract_structured_data(text, document_type, model_name)
+                for text, document_type in documents
+            )
+        )
+    )
+
+
+def extract_structured_data_chunked(
+    pages: Iterable[str],
+    document_type: str,
+    model_name: str = "gemini-2.0-flash",
+    max_chunk_chars: int = _CHUNK_MAX_CHARS,
+) -> DocumentExtraction:
+    """
+    Extract a long document chunk by chunk (map-reduce).
+
+    *pages* is consumed lazily (see ``iter_document_pages``) and grouped
+    into chunks of at most *max_chunk_chars* characters; a single larger
+    page forms a chunk of its own.  Each chunk is sent to Gemini as soon
+    as it is complete, so early chunks are extracted while later pages are
+    still being parsed.  The chunk extractions are then combined in
+    document order, merging areas that share a name.
+
+    Parameters:
+        pages:           Page texts of the document, in order.
+        document_type:   Either ``"inspection_report"`` or ``"thermal_report"``.
+        model_name:      The Gemini model name to use for extraction.
+        max_chunk_chars: Upper bound on the page text sent per call.
+
+    Returns:
+        A validated ``DocumentExtraction`` Pydantic model.
+    """
+    with ThreadPoolExecutor(max_workers=_CHUNK_WORKERS) as pool:
+        futures = [
+            pool.submit(extract_structured_data, chunk, document_type, model_name)
+            for chunk in _group_pages(pages, max_chunk_chars)
+        ]
+        parts = [fut.result() for fut in futures]
+
+    if not parts:
+        logger.warning("No page text provided — returning empty extraction.")
+        return DocumentExtraction(areas=[], global_notes=[])
+    if len(parts) == 1:
+        return parts[0]
+
+    logger.info(
+        "Combining %d chunk extractions (doc_type=%s).", len(parts), document_type
+    )
+    return _combine_extractions(parts)
+
+
+# ---------------------------------------------------------------------------
+# Gemini calls
+# ---------------------------------------------------------------------------
+
+# Rate-limited (429) calls are retried with backoff up to _MAX_ATTEMPTS
+# calls; a truncated response is retried with a larger output budget up to
+# _MAX_TRUNCATION_ATTEMPTS calls.  The two are counted separately.
+_MAX_ATTEMPTS = 5
+_MAX_TRUNCATION_ATTEMPTS = 3
+
+
+def _call_gemini_extract(
+    model_name: str,
+    static_prefix: str,
+    prompt: str,
+    response_schema: Optional[type[BaseModel]] = None,
+) -> str:
+    """
+    Call Gemini with retry logic for rate-limits and truncation.
+
+    *static_prefix* is the fixed part of the prompt template and is served
+    from a context cache when possible; *prompt* is the per-document part.
+    When *response_schema* is given, Gemini's JSON mode is enabled and
+    decoding is constrained to that schema.
+    """
     max_tokens = 16384  # generous limit to avoid truncation
 
-    for attempt in range(1, 4):
+    rate_limited = 0
+    responses = 0
+    while True:
         try:
-            model = genai.GenerativeModel(
-                model_name=model_name,
-                system_instruction=(
-                    "You are a precise data-extraction assistant. "
-                    "Return ONLY valid JSON with no additional text. "
-                    "Keep responses concise — use short descriptions."
-                ),
-                generation_config=genai.types.GenerationConfig(
-                    temperature=0.0,
-                    max_output_tokens=max_tokens,
-                ),
+            response = context_cache.generate_content(
+                model_name,
+                _SYSTEM_INSTRUCTION,
+                static_prefix,
+                prompt,
+                _extraction_config(max_tokens, response_schema),
             )
-            response = model.generate_content(prompt)
             raw = response.text.strip()
+        except Exception as retry_exc:
+            rate_limited += 1
+            wait = gemini_client.retry_delay(retry_exc, rate_limited, _MAX_ATTEMPTS)
+            if wait is None:
+                raise
+            time.sleep(wait)
+            continue
 
-            # Check if response looks truncated (no closing brace)
-            cleaned = _strip_json_fences(raw)
-            if cleaned and not cleaned.rstrip().endswith("}"):
-                logger.warning(
-                    "Response appears truncated (attempt %d/3). Retrying with higher limit...",
-                    attempt,
-                )
-                max_tokens = min(max_tokens + 8192, 65536)
-                time.sleep(5)
-                continue
+        responses += 1
+        if responses < _MAX_TRUNCATION_ATTEMPTS and _looks_truncated(raw, responses):
+            max_tokens = min(max_tokens + 8192, 65536)
+            time.sleep(5)
+            continue
 
-            return raw
+        # The last response is returned even if it is still truncated
+        return raw
 
+
+async def _acall_gemini_extract(
+    model_name: str,
+    static_prefix: str,
+    prompt: str,
+    response_schema: Optional[type[BaseModel]] = None,
+) -> str:
+    """Async counterpart of ``_call_gemini_extract``."""
+    max_tokens = 16384  # generous limit to avoid truncation
+
+    rate_limited = 0
+    responses = 0
+    while True:
+        try:
+            response = await context_cache.agenerate_content(
+                model_name,
+                _SYSTEM_INSTRUCTION,
+                static_prefix,
+                prompt,
+                _extraction_config(max_tokens, response_schema),
+            )
+            raw = response.text.strip()
         except Exception as retry_exc:
-            if "429" in str(retry_exc) and attempt < 3:
-                wait = 30 * attempt
-                logger.warning(
-                    "Rate limited (attempt %d/3). Waiting %ds...",
-                    attempt, wait,
-                )
-                time.sleep(wait)
-            else:
+            rate_limited += 1
+            wait = gemini_client.retry_delay(retry_exc, rate_limited, _MAX_ATTEMPTS)
+            if wait is None:
                 raise
+            await asyncio.sleep(wait)
+            continue
+
+        responses += 1
+        if responses < _MAX_TRUNCATION_ATTEMPTS and _looks_truncated(raw, responses):
+            max_tokens = min(max_tokens + 8192, 65536)
+            await asyncio.sleep(5)
+            continue
+
+        # The last response is returned even if it is still truncated
+        return raw
+
+
+@functools.lru_cache(maxsize=32)
+def _extraction_config(
+    max_tokens: int, response_schema: Optional[type[BaseModel]]
+) -> dict:
+    """
+    Build the generation config, enabling JSON mode for *response_schema*.
+
+    The config is returned in the SDK's normalised dict form (the schema
+    already converted to a ``protos.Schema``) and cached per
+    (*max_tokens*, *response_schema*), so repeated calls skip the schema
+    conversion the SDK would otherwise redo on every request.  The dict is
+    shared and must not be mutated.
+    """
+    json_mode = (
+        {
+            "response_mime_type": "application/json",
+            "response_schema": gemini_response_schema(response_schema),
+        }
+        if response_schema is not None
+        else {}
+    )
+    return genai.types.generation_types.to_generation_config_dict(
+        genai.types.GenerationConfig(
+            temperature=0.0,
+            max_output_tokens=max_tokens,
+            **json_mode,
+        )
+    )
+
+
+def _looks_truncated(raw: str, attempt: int) -> bool:
+    """Return True (and log) if *raw* lacks its closing brace."""
+    cleaned = _strip_json_fences(raw)
+    if cleaned and not cleaned.rstrip().endswith("}"):
+        logger.warning(
+            "Response appears truncated (attempt %d/%d). Retrying with higher limit...",
+            attempt, _MAX_TRUNCATION_ATTEMPTS,
+        )
+        return True
+    return False
+
+
+# ---------------------------------------------------------------------------
+# Prompt building and logging
+# ---------------------------------------------------------------------------
+
+
+def _build_extraction_prompt(document_text: str, document_type: str) -> tuple[str, str]:
+    """Return ``(static_prefix, prompt)`` for a single-document extraction."""
+    static_prefix, request_template = context_cache.split_template(
+        _load_extraction_prompt(), _EXTRACTION_REQUEST_MARKER
+    )
+    prompt = request_template.format(
+        document_type=document_type,
+        document_text=document_text,
+    )
+    return static_prefix, prompt
+
+
+def _build_pair_prompt(inspection_text: str, thermal_text: str) -> tuple[str, str]:
+    """Return ``(static_prefix, prompt)`` for a pair extraction."""
+    static_prefix, request_template = context_cache.split_template(
+        _load_pair_extraction_prompt(), _PAIR_REQUEST_MARKER
+    )
+    prompt = request_template.format(
+        inspection_text=inspection_text,
+        thermal_text=thermal_text,
+    )
+    return static_prefix, prompt
+
+
+def _log_extraction_request(model_name: str, document_type: str, document_text: str) -> None:
+    """Log an outgoing single-document extraction request."""
+    logger.info(
+        "Sending extraction request to %s (doc_type=%s, text_len=%d)",
+        model_name,
+        document_type,
+        len(document_text),
+    )
+
+
+def _log_pair_request(model_name: str, inspection_text: str, thermal_text: str) -> None:
+    """Log an outgoing pair extraction request."""
+    logger.info(
+        "Sending pair extraction request to %s (inspection_len=%d, thermal_len=%d)",
+        model_name,
+        len(inspection_text),
+        len(thermal_text),
+    )
+
 
-    # If all retries resulted in truncation, return the last response anyway
-    return raw  # noqa: F821 — variable is set in the loop
+def _parse_extraction(raw_content: str) -> tuple[DocumentExtraction, bool]:
+    """Parse and log a single-document response; returns (extraction, complete)."""
+    extraction, complete = _parse_response(raw_content, DocumentExtraction)
+    logger.info(
+        "Extraction complete — %d areas, %d global notes.",
+        len(extraction.areas),
+        len(extraction.global_notes),
+    )
+    return extraction, complete
+
+
+def _parse_pair(raw_content: str) -> tuple[PairExtraction, bool]:
+    """Parse and log a pair extraction response; returns (pair, complete)."""
+    pair, complete = _parse_response(raw_content, PairExtraction)
+    logger.info(
+        "Pair extraction complete — inspection: %d areas, thermal: %d areas.",
+        len(pair.inspection.areas),
+        len(pair.thermal.areas),
+    )
+    return pair, complete
 
 
 # ---------------------------------------------------------------------------
@@ -215,78 +674,160 @@ def _call_gemini_extract(model_name: str, prompt: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _strip_json_fences(text: str) -> str:
-    """Remove markdown code fences (```json ... ```) if present."""
-    text = text.strip()
-    if text.startswith("```"):
-        # Remove opening fence (may include language tag)
-        first_newline = text.index("\n")
-        text = text[first_newline + 1 :]
-    if text.endswith("```"):
-        text = text[: -3]
-    return text.strip()
+def gemini_response_schema(model_cls: type[BaseModel]) -> dict:
+    """
+    Convert a Pydantic model into a Gemini ``response_schema`` dict.
+
+    Gemini accepts only a subset of OpenAPI: no ``$ref``, ``title`` or
+    ``default`` keys, and nullability is a flag rather than an
+    ``anyOf [..., null]`` union.  This resolves and strips all of those.
+    """
+    schema = model_cls.model_json_schema()
+    defs = schema.pop("$defs", {})
+
+    def convert(node: dict) -> dict:
+        if "$ref" in node:
+            node = {**defs[node["$ref"].rsplit("/", 1)[-1]], **{
+                k: v for k, v in node.items() if k != "$ref"
+            }}
+        if "anyOf" in node:
+            variants = [v for v in node["anyOf"] if v.get("type") != "null"]
+            out = convert(variants[0])
+            if len(variants) < len(node["anyOf"]):
+                out["nullable"] = True
+            if "description" in node:
+                out["description"] = node["description"]
+            return out
+
+        out: dict = {"type": node["type"].upper()}
+        if "description" in node:
+            out["description"] = node["description"]
+        if node["type"] == "object":
+            out["properties"] = {
+                name: convert(prop) for name, prop in node["properties"].items()
+            }
+            if node.get("required"):
+                out["required"] = node["required"]
+        elif node["type"] == "array":
+            out["items"] = convert(node["items"])
+        return out
+
+    return convert(schema)
+
+
+def _group_pages(pages: Iterable[str], max_chars: int) -> Iterator[str]:
+    """Join consecutive pages into chunks of at most *max_chars* characters."""
+    chunk: list[str] = []
+    size = 0
+    for page in pages:
+        if chunk and size + len(page) > max_chars:
+            yield "\n\n".join(chunk)
+            chunk, size = [], 0
+        chunk.append(page)
+        size += len(page) + 2  # the blank line joining it to the next page
+    if chunk:
+        yield "\n\n".join(chunk)
+
+
+_LIST_FIELDS = (
+    "inspection_observations",
+    "thermal_findings",
+    "temperature_readings",
+    "visible_damage",
+)
+_TEXT_FIELDS = ("moisture_presence", "other_notes")
+
+
+def _combine_extractions(parts: list[DocumentExtraction]) -> DocumentExtraction:
+    """
+    Combine per-chunk extractions of one document.
+
+    An area that spans chunks is reported once per chunk; those entries
+    (same name, ignoring case) are folded into the first one — list fields
+    are concatenated and text fields joined with ``"; "``.  Chunks often
+    restate the same finding, so repeated list items, text parts and
+    global notes are dropped, keeping the first occurrence.
+    """
+    areas: dict[str, AreaExtraction] = {}
+    global_notes: list[str] = []
+
+    for part in parts:
+        for area in part.areas:
+            key = area.area_name.strip().lower()
+            combined = areas.get(key)
+            if combined is None:
+                areas[key] = area.model_copy()
+                continue
+            for field in _LIST_FIELDS:
+                extra = getattr(area, field)
+                if extra:
+                    items = (getattr(combined, field) or []) + extra
+                    setattr(combined, field, list(dict.fromkeys(items)))
+            for field in _TEXT_FIELDS:
+                extra = getattr(area, field)
+                if extra:
+                    current = getattr(combined, field)
+                    if not current:
+                        setattr(combined, field, extra)
+                    elif extra not in current.split("; "):
+                        setattr(combined, field, f"{current}; {extra}")
+        global_notes.extend(part.global_notes)
+
+    return DocumentExtraction(
+        areas=list(areas.values()),
+        global_notes=list(dict.fromkeys(global_notes)),
+    )
+
+
+# Optional opening fence (with language tag) and optional closing fence —
+# a truncated response has only the former.  Always matches.
+_FENCE_RE = re.compile(r"\A(?:```[^\n]*\n)?(.*?)(?:```)?\Z", re.DOTALL)
 
 
-def _repair_truncated_json(text: str) -> str:
+def _parse_response(raw_content: str, schema: type[ModelT]) -> tuple[ModelT, bool]:
     """
-    Attempt to repair truncated JSON by closing unclosed brackets/braces.
+    Clean, repair, and validate a raw JSON response against *schema*.
+
+    Parsing and validation happen in one pass (``model_validate_json``)
+    without building an intermediate dict.  If that pass finds malformed
+    JSON — typically a response cut off mid-output — the valid prefix is
+    parsed instead with pydantic-core's partial JSON mode, which closes
+    open strings, arrays and objects and drops a dangling key.
+
+    Returns:
+        ``(model, complete)`` — *complete* is False if only a prefix of
+        the response could be parsed, in which case the model is likely
+        missing data and should not be cached.
 
-    This handles the common case where the LLM output was cut off mid-response,
-    leaving unterminated strings, arrays, or objects.
+    Raises:
+        json.JSONDecodeError: if not even a prefix of the response is JSON.
+        pydantic.ValidationError: if it is valid JSON of the wrong shape.
     """
-    text = text.rstrip()
+    logger.debug("Raw LLM response (first 500 chars): %s", raw_content[:500])
+
+    # Clean potential markdown fences the model may add despite instructions
+    raw_content = _strip_json_fences(raw_content)
 
-    # If it already parses, return as-is
     try:
-        json.loads(text)
-        return text
-    except json.JSONDecodeError:
-        pass
-
-    # Strategy: find the last valid position and close everything after it
-    # First, try to fix unterminated strings by adding a closing quote
-    # Then close any open brackets/braces
-
-    # Count open/close brackets
-    in_string = False
-    escape_next = False
-    open_stack = []
-
-    for ch in text:
-        if escape_next:
-            escape_next = False
-            continue
-        if ch == '\\' and in_string:
-            escape_next = True
-            continue
-        if ch == '"' and not escape_next:
-            in_string = not in_string
-            continue
-        if in_string:
-            continue
-        if ch in '{[':
-            open_stack.append(ch)
-        elif ch == '}' and open_stack and open_stack[-1] == '{':
-            open_stack.pop()
-        elif ch == ']' and open_stack and open_stack[-1] == '[':
-            open_stack.pop()
-
-    # Build repair suffix
-    repair = ""
-
-    # If we're inside a string, close it
-    if in_string:
-        repair += '"'
-
-    # Close any open arrays/objects in reverse order
-    for bracket in reversed(open_stack):
-        if bracket == '{':
-            repair += '}'
-        elif bracket == '[':
-            repair += ']'
-
-    if repair:
-        logger.warning("Repairing truncated JSON — appending: %s", repr(repair))
-        text = text + repair
-
-    return text
+        return schema.model_validate_json(raw_content), True
+    except ValidationError as exc:
+        if not _is_json_error(exc):
+            raise
+
+    try:
+        data = from_json(raw_content, allow_partial="trailing-strings")
+    except ValueError:
+        json.loads(raw_content)  # re-raise as JSONDecodeError with position
+        raise
+    logger.warning("Response was incomplete JSON — parsed its valid prefix.")
+    return schema.model_validate(data), False
+
+
+def _is_json_error(exc: ValidationError) -> bool:
+    """Return True if *exc* reports malformed JSON rather than a schema mismatch."""
+    return any(err["type"] == "json_invalid" for err in exc.errors())
+
+
+def _strip_json_fences(text: str) -> str:
+    """Remove markdown code fences (```json ... ```) if present."""
+    return _FENCE_RE.match(text.strip()).group(1).strip()
@@ -0,0 +1,154 @@
+"""
+Gemini Client Module
+====================
+Process-wide access to the Google Gemini SDK.
+
+Responsibilities:
+    - Configure the SDK (API key) exactly once per process
+    - Hand out cached ``GenerativeModel`` instances so the SDK client is
+      built once and reused across calls and requests
+    - Cap the number of in-flight requests (``GEMINI_MAX_CONCURRENCY``)
+    - Decide how long to back off before retrying a rate-limited call
+
+``GenerativeModel`` objects are safe to share between threads for
+inference; per-call settings such as the generation config are passed to
+``generate_content`` rather than baked into the model.
+"""
+
+import asyncio
+import functools
+import logging
+import os
+import random
+import re
+import threading
+import weakref
+from typing import Optional
+
+import google.generativeai as genai
+from google.api_core import exceptions as google_exceptions
+
+logger = logging.getLogger(__name__)
+
+_configured_key: Optional[str] = None
+_configure_lock = threading.Lock()
+
+_DEFAULT_MAX_CONCURRENCY = 8
+
+# Rate-limit backoff: the server's suggested delay, else 2**attempt
+# seconds, capped, plus up to a second of jitter so concurrent callers
+# that were throttled together do not all retry at the same instant.
+_BACKOFF_CAP_SECONDS = 60
+_RETRY_DELAY_RE = re.compile(r"retry_delay\s*\{\s*seconds:\s*(\d+)")
+
+# asyncio primitives belong to a single event loop, so each loop gets its
+# own semaphore.
+_semaphores: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Semaphore]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def configure(api_key: str) -> None:
+    """Configure the Gemini SDK; repeat calls with the same key are no-ops."""
+    global _configured_key
+    with _configure_lock:
+        if api_key == _configured_key:
+            return
+        genai.configure(api_key=api_key)
+        if _configured_key is not None:
+            # Cached models hold a client bound to the previous key.
+            get_model.cache_clear()
+        _configured_key = api_key
+        logger.info("Gemini SDK configured.")
+
+
+@functools.lru_cache(maxsize=8)
+def get_model(
+    model_name: str, system_instruction: Optional[str] = None
+) -> genai.GenerativeModel:
+    """Return a shared model for (*model_name*, *system_instruction*)."""
+    return genai.GenerativeModel(
+        model_name=model_name,
+        system_instruction=system_instruction,
+    )
+
+
+def max_concurrency() -> int:
+    """Return the configured cap on in-flight requests (``GEMINI_MAX_CONCURRENCY``)."""
+    limit = int(os.getenv("GEMINI_MAX_CONCURRENCY", _DEFAULT_MAX_CONCURRENCY))
+    return max(limit, 1)
+
+
+def concurrency_limit() -> asyncio.Semaphore:
+    """
+    Return the semaphore that caps in-flight async requests on this loop.
+
+    The limit is read from ``GEMINI_MAX_CONCURRENCY`` (default 8) when the
+    running event loop first asks for it.
+    """
+    loop = asyncio.get_running_loop()
+    semaphore = _semaphores.get(loop)
+    if semaphore is None:
+        semaphore = _semaphores[loop] = asyncio.Semaphore(max_concurrency())
+    return semaphore
+
+
+def retry_delay(exc: Exception, attempt: int, max_attempts: int) -> Optional[float]:
+    """
+    Return the seconds to wait before retrying *exc*, or None to give up.
+
+    Only rate-limit errors (HTTP 429 / ``ResourceExhausted``) are retried.
+    A delay suggested by the server (``Retry-After`` header or the
+    ``RetryInfo`` error detail) is honoured; otherwise the wait grows
+    exponentially with *attempt*.  Either way the wait is capped at
+    ``_BACKOFF_CAP_SECONDS`` and jittered, so a huge hint cannot stall a
+    request and callers given the same hint do not retry in lockstep.
+    """
+    if attempt >= max_attempts or not _is_rate_limited(exc):
+        return None
+
+    wait = _server_retry_delay(exc)
+    if wait is None:
+        wait = 2 ** attempt
+    wait = min(_BACKOFF_CAP_SECONDS, max(0.0, wait)) + random.uniform(0, 1)
+    logger.warning(
+        "Rate limited (attempt %d/%d). Waiting %.1fs...",
+        attempt, max_attempts, wait,
+    )
+    return wait
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _is_rate_limited(exc: Exception) -> bool:
+    """Return True if *exc* is a quota / rate-limit error."""
+    return isinstance(exc, google_exceptions.ResourceExhausted) or "429" in str(exc)
+
+
+def _server_retry_delay(exc: Exception) -> Optional[float]:
+    """Return the retry delay the server asked for in *exc*, if any."""
+    headers = getattr(getattr(exc, "response", None), "headers", None)
+    if headers:
+        try:
+            return float(headers.get("Retry-After"))
+        except (TypeError, ValueError):
+            pass
+
+    for detail in getattr(exc, "details", None) or ():
+        delay = getattr(detail, "retry_delay", None)
+        if delay is None:
+            continue
+        if hasattr(delay, "total_seconds"):
+            return delay.total_seconds()
+        return delay.seconds + delay.nanos / 1e9
+
+    match = _RETRY_DELAY_RE.search(str(exc))
+    return float(match.group(1)) if match else None
@@ -0,0 +1,182 @@
+"""
+LLM Response Cache Module
+=========================
+Small on-disk cache for Gemini responses so that re-running the pipeline
+on the same documents does not pay for the same LLM call twice.
+
+Responsibilities:
+    - Derive a stable cache key from (model, task type, prompt text)
+    - Store and fetch raw response strings in a SQLite database
+    - Expire entries after a fixed time-to-live and delete them on write
+    - Keep the database under ``DDR_CACHE_MAX_MB`` by dropping the oldest
+      entries
+    - Switch off entirely with ``DDR_CACHE_ENABLED=0``; callers such as the
+      API server can also change the default used when it is unset
+
+The cache is best-effort: any storage error is logged and treated as a
+miss, so a broken cache directory never fails a pipeline run.
+"""
+
+import hashlib
+import logging
+import os
+import sqlite3
+import time
+from contextlib import closing
+from pathlib import Path
+from typing import Optional
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Constants
+# ---------------------------------------------------------------------------
+
+# Bump when the cached payload format changes so old entries are ignored.
+_CACHE_VERSION = "1"
+
+_DEFAULT_CACHE_DIR = ".cache/ddr"
+_DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60  # 7 days
+_DEFAULT_MAX_MB = 64
+_DB_FILENAME = "llm_cache.sqlite3"
+
+_FALSE_VALUES = {"0", "false", "no", "off"}
+
+# Whether the cache is on when ``DDR_CACHE_ENABLED`` is unset; the API
+# server switches this off while it runs (see ``set_default_enabled``).
+_default_enabled = True
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def make_key(model_name: str, task_type: str, text: str) -> str:
+    """Return the cache key for one LLM call."""
+    raw = f"{_CACHE_VERSION}|{model_name}|{task_type}|{text}"
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+def get(model_name: str, task_type: str, text: str) -> Optional[str]:
+    """
+    Look up a cached response.
+
+    Returns:
+        The cached response string, or ``None`` on a miss / expired entry
+        (always ``None`` when the cache is disabled).
+    """
+    if not _enabled():
+        return None
+    key = make_key(model_name, task_type, text)
+    try:
+        with closing(_connect()) as conn:
+            row = conn.execute(
+                "SELECT value, created_at FROM responses WHERE key = ?", (key,)
+            ).fetchone()
+    except sqlite3.Error as exc:
+        logger.warning("LLM cache read failed: %s", exc)
+        return None
+
+    if row is None:
+        return None
+
+    value, created_at = row
+    if time.time() - created_at > _DEFAULT_TTL_SECONDS:
+        logger.debug("LLM cache entry expired (task=%s).", task_type)
+        return None
+
+    logger.info("LLM cache hit (model=%s, task=%s).", model_name, task_type)
+    return value
+
+
+def put(model_name: str, task_type: str, text: str, value: str) -> None:
+    """
+    Store *value* as the response for (model, task type, text).
+
+    Each write also deletes expired entries, then the oldest entries
+    beyond the ``DDR_CACHE_MAX_MB`` size limit, so the database does not
+    grow without bound.
+    """
+    if not _enabled():
+        return
+    key = make_key(model_name, task_type, text)
+    now = time.time()
+    try:
+        with closing(_connect()) as conn, conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO responses (key, value, created_at) "
+                "VALUES (?, ?, ?)",
+                (key, value, now),
+            )
+            conn.execute(
+                "DELETE FROM responses WHERE created_at < ?",
+                (now - _DEFAULT_TTL_SECONDS,),
+            )
+            # Keep the newest entries whose combined size fits the limit.
+            conn.execute(
+                "DELETE FROM responses WHERE key IN ("
+                "SELECT key FROM (SELECT key, SUM(length(CAST(value AS BLOB))) "
+                "OVER (ORDER BY created_at DESC, key) AS total FROM responses) "
+                "WHERE total > ?)",
+                (_max_bytes(),),
+            )
+    except sqlite3.Error as exc:
+        logger.warning("LLM cache write failed: %s", exc)
+
+
+def set_default_enabled(enabled: bool) -> None:
+    """
+    Set whether the cache is used when ``DDR_CACHE_ENABLED`` is unset.
+
+    An explicit ``DDR_CACHE_ENABLED`` always wins.  The default is on;
+    the API server turns it off for its lifetime.
+    """
+    global _default_enabled
+    _default_enabled = enabled
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _enabled() -> bool:
+    """Return whether to use the cache (``DDR_CACHE_ENABLED``, else the default)."""
+    value = os.getenv("DDR_CACHE_ENABLED")
+    if value is None or not value.strip():
+        return _default_enabled
+    return value.strip().lower() not in _FALSE_VALUES
+
+
+def _max_bytes() -> int:
+    """Resolve the size limit from ``DDR_CACHE_MAX_MB``."""
+    try:
+        max_mb = float(os.getenv("DDR_CACHE_MAX_MB", _DEFAULT_MAX_MB))
+    except ValueError:
+        logger.warning("Invalid DDR_CACHE_MAX_MB; using %d.", _DEFAULT_MAX_MB)
+        max_mb = _DEFAULT_MAX_MB
+    return int(max_mb * 1024 * 1024)
+
+
+def _cache_dir() -> Path:
+    """Resolve the cache directory from ``DDR_CACHE_DIR``."""
+    return Path(os.getenv("DDR_CACHE_DIR", _DEFAULT_CACHE_DIR))
+
+
+def _connect() -> sqlite3.Connection:
+    """Open the cache database, creating it on first use."""
+    cache_dir = _cache_dir()
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    conn = sqlite3.connect(str(cache_dir / _DB_FILENAME), timeout=10)
+    # Responses quote document text: overwrite deleted rows on disk.
+    conn.execute("PRAGMA secure_delete = ON")
+    conn.execute(
+        "CREATE TABLE IF NOT EXISTS responses ("
+        "key TEXT PRIMARY KEY, value TEXT NOT NULL, created_at REAL NOT NULL)"
+    )
+    conn.execute(
+        "CREATE INDEX IF NOT EXISTS responses_created_at "
+        "ON responses (created_at)"
+    )
+    return conn
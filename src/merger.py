@@ -13,10 +13,11 @@ Responsibilities:
 """
 
 import logging
-from difflib import SequenceMatcher
 from typing import Optional
 
-from pydantic import BaseModel, Field
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr
+from rapidfuzz import fuzz, process
 
 from .extractor import AreaExtraction, DocumentExtraction
 
@@ -53,6 +54,23 @@ class MergedData(BaseModel):
     global_notes: list[str] = Field(default_factory=list)
     duplicate_warnings: list[str] = Field(default_factory=list)
 
+    # Areas with a detected conflict.  Filled in by ``merge_extractions``
+    # (or lazily on first access) so callers don't each rescan ``areas``.
+    # Private, so it is never part of the serialised output.
+    _conflict_areas: Optional[list[MergedArea]] = PrivateAttr(default=None)
+
+    @property
+    def conflict_areas(self) -> list[MergedArea]:
+        """Areas whose inspection and thermal data disagree."""
+        if self._conflict_areas is None:
+            self._conflict_areas = [a for a in self.areas if a.conflict_detected]
+        return self._conflict_areas
+
+    @property
+    def conflict_count(self) -> int:
+        """Number of areas with a detected conflict."""
+        return len(self.conflict_areas)
+
 
 # ---------------------------------------------------------------------------
 # Public API
@@ -67,9 +85,11 @@ def merge_extractions(
     """
     Merge *inspection* and *thermal* extractions into a single ``MergedData``.
 
-    Area matching is performed using fuzzy string similarity on area names.
-    The *similarity_threshold* (0–1) controls how close two names must be
-    to be considered the same area.
+    Areas with identical names (ignoring case and surrounding whitespace)
+    are matched first; the rest are matched by fuzzy string similarity on
+    area names.  The *similarity_threshold* (0–1) controls how close two names must be
+    to be considered the same area.  Each thermal area is matched to at
+    most one inspection area.
     """
     logger.info(
         "Merging extractions: %d inspection areas, %d thermal areas.",
@@ -78,17 +98,16 @@ def merge_extractions(
     )
 
     merged_areas: list[MergedArea] = []
+    conflict_areas: list[MergedArea] = []
     duplicate_warnings: list[str] = []
 
     # Track which thermal areas have been matched
     matched_thermal_indices: set[int] = set()
 
-    # --- Step 1: For each inspection area, find the best thermal match ---
-    for insp_area in inspection.areas:
-        best_idx, best_score = _find_best_match(
-            insp_area.area_name, thermal.areas, similarity_threshold
-        )
+    matches = _match_areas(inspection.areas, thermal.areas, similarity_threshold)
 
+    # --- Step 1: For each inspection area, take its thermal match ---
+    for insp_area, (best_idx, best_score) in zip(inspection.areas, matches):
         if best_idx is not None:
             therm_area = thermal.areas[best_idx]
             matched_thermal_indices.add(best_idx)
@@ -99,6 +118,8 @@ def merge_extractions(
                 best_score,
             )
             merged = _merge_two_areas(insp_area, therm_area, duplicate_warnings)
+            if merged.conflict_detected:
+                conflict_areas.append(merged)
         else:
             # No thermal match — inspection-only area
             merged = _area_from_single(insp_area, source="inspection_report")
@@ -126,6 +147,7 @@ def merge_extractions(
         global_notes=global_notes,
         duplicate_warnings=duplicate_warnings,
     )
+    result._conflict_areas = conflict_areas
     logger.info(
         "Merge complete — %d areas, %d duplicate warnings.",
         len(result.areas),
@@ -137,29 +159,80 @@ def merge_extractions(
 # ---------------------------------------------------------------------------
 # Internal helpers
 # ---------------------------------------------------------------------------
+# ``MergedArea`` objects are built with ``model_construct``: every value is
+# derived from already-validated ``AreaExtraction`` fields, so running the
+# validators again would only cost time.  Every field is passed explicitly.
+
+
+# Similarities below are RapidFuzz ``fuzz.ratio`` scores (the normalised
+# Indel similarity, the C++ counterpart of ``difflib``'s ratio) scaled to
+# the 0–1 range the thresholds are expressed in.
 
 
-def _find_best_match(
-    name: str,
-    candidates: list[AreaExtraction],
+def _normalise_name(name: str) -> str:
+    """Normalise an area name for fuzzy comparison."""
+    return name.lower().strip()
+
+
+def _match_areas(
+    inspection_areas: list[AreaExtraction],
+    thermal_areas: list[AreaExtraction],
     threshold: float,
-) -> tuple[Optional[int], float]:
-    """Return the index and score of the best matching candidate, or (None, 0)."""
-    best_idx: Optional[int] = None
-    best_score: float = 0.0
-    name_lower = name.lower().strip()
+) -> list[tuple[Optional[int], float]]:
+    """
+    Pair each inspection area with its best still-unmatched thermal area.
 
-    for idx, cand in enumerate(candidates):
-        score = SequenceMatcher(
-            None, name_lower, cand.area_name.lower().strip()
-        ).ratio()
-        if score > best_score:
-            best_score = score
-            best_idx = idx
+    Identical (normalised) names are paired first with a dict lookup, in
+    inspection order; they score 1.0, so no fuzzy comparison is needed.
+    For the rest, the remaining inspection × thermal similarity matrix is
+    computed in one ``process.cdist`` call and areas are assigned greedily
+    in inspection order, each taking the highest-scoring thermal column not
+    yet claimed (first column on ties).
+
+    Returns:
+        One ``(thermal_index, score)`` per inspection area, or
+        ``(None, 0.0)`` where no unmatched candidate reaches *threshold*.
+    """
+    matches: list[tuple[Optional[int], float]] = [(None, 0.0)] * len(inspection_areas)
+    if not inspection_areas or not thermal_areas:
+        return matches
+
+    insp_names = [_normalise_name(area.area_name) for area in inspection_areas]
+    therm_names = [_normalise_name(area.area_name) for area in thermal_areas]
+
+    # Exact pass: name -> unclaimed thermal indices, earliest last (for pop)
+    therm_index: dict[str, list[int]] = {}
+    for j in range(len(therm_names) - 1, -1, -1):
+        therm_index.setdefault(therm_names[j], []).append(j)
+
+    fuzzy_rows: list[int] = []
+    for i, name in enumerate(insp_names):
+        candidates = therm_index.get(name)
+        if candidates:
+            matches[i] = (candidates.pop(), 1.0)
+        else:
+            fuzzy_rows.append(i)
+
+    fuzzy_cols = sorted(j for indices in therm_index.values() for j in indices)
+    if not fuzzy_rows or not fuzzy_cols:
+        return matches
+
+    # Fuzzy pass over whatever the exact pass left unmatched
+    scores = process.cdist(
+        [insp_names[i] for i in fuzzy_rows],
+        [therm_names[j] for j in fuzzy_cols],
+        scorer=fuzz.ratio,
+        dtype=np.float64,
+    )
+    cutoff = threshold * 100
 
-    if best_score >= threshold:
-        return best_idx, best_score
-    return None, 0.0
+    for i, row in zip(fuzzy_rows, scores):
+        best_col = int(np.argmax(row))
+        best_score = row[best_col]
+        if best_score >= cutoff:
+            matches[i] = (fuzzy_cols[best_col], best_score / 100)
+            scores[:, best_col] = -1.0  # claimed — mask for later rows
+    return matches
 
 
 def _merge_two_areas(
@@ -211,7 +284,7 @@ def _merge_two_areas(
             f"Notes conflict — Inspection: '{insp.other_notes}' vs Thermal: '{therm.other_notes}'"
         )
 
-    return MergedArea(
+    return MergedArea.model_construct(
         area_name=area_name,
         inspection_observations=inspection_obs,
         thermal_findings=thermal_findings,
@@ -227,7 +300,7 @@ def _merge_two_areas(
 
 def _area_from_single(area: AreaExtraction, source: str) -> MergedArea:
     """Create a ``MergedArea`` from a single-source area."""
-    return MergedArea(
+    return MergedArea.model_construct(
         area_name=area.area_name,
         inspection_observations=area.inspection_observations or [],
         thermal_findings=area.thermal_findings or [],
@@ -264,7 +337,7 @@ def _merge_optional_field(
         return a, False
 
     # Both present — check for conflict
-    similarity = SequenceMatcher(None, a.lower(), b.lower()).ratio()
+    similarity = fuzz.ratio(a.lower(), b.lower()) / 100
     if similarity > 0.75:
         # Similar enough — take the longer one
         return max(a, b, key=len), False
@@ -289,27 +362,52 @@ def _deduplicate_strings(
 
     Uses fuzzy similarity; exact duplicates are always removed.
     Appends warnings to *dup_warnings* for any duplicates found.
+
+    Items are kept in order unless they (case-insensitively) equal a kept
+    item, or are at least *threshold* similar to one — the earliest such
+    kept item is reported.  Exact repeats are caught with a dict lookup;
+    the fuzzy check reads one precomputed ``process.cdist`` score matrix
+    over the distinct strings.
     """
-    if not items:
+    stripped = [s for s in (item.strip() for item in items) if s]
+    if not stripped:
         return []
 
+    distinct = list(dict.fromkeys(s.lower() for s in stripped))
+    position = {s: i for i, s in enumerate(distinct)}
+    cutoff = threshold * 100
+    scores = process.cdist(
+        distinct, distinct, scorer=fuzz.ratio, score_cutoff=cutoff, dtype=np.float64
+    )
+    # kept[i] — whether distinct[i] is already in ``unique``.  Distinct
+    # strings are numbered in first-appearance order, so the lowest kept
+    # index is also the earliest kept item.
+    kept = np.zeros(len(distinct), dtype=bool)
+
     unique: list[str] = []
-    for item in items:
-        item_stripped = item.strip()
-        if not item_stripped:
+    kept_by_lower: dict[str, str] = {}
+    for item in stripped:
+        item_lower = item.lower()
+
+        existing = kept_by_lower.get(item_lower)
+        if existing is not None:
+            dup_warnings.append(
+                f"Duplicate removed (sim=1.00): '{item}' ≈ '{existing}'"
+            )
             continue
-        is_dup = False
-        for existing in unique:
-            sim = SequenceMatcher(
-                None, item_stripped.lower(), existing.lower()
-            ).ratio()
-            if sim >= threshold:
-                is_dup = True
-                dup_warnings.append(
-                    f"Duplicate removed (sim={sim:.2f}): '{item_stripped}' ≈ '{existing}'"
-                )
-                break
-        if not is_dup:
-            unique.append(item_stripped)
+
+        idx = position[item_lower]
+        similar = np.flatnonzero(kept & (scores[idx] >= cutoff))
+        if similar.size:
+            match = int(similar[0])
+            dup_warnings.append(
+                f"Duplicate removed (sim={scores[idx, match] / 100:.2f}): "
+                f"'{item}' ≈ '{kept_by_lower[distinct[match]]}'"
+            )
+            continue
+
+        unique.append(item)
+        kept[idx] = True
+        kept_by_lower[item_lower] = item
 
     return unique
@@ -0,0 +1,149 @@
+"""
+One-Shot Merger Module
+======================
+Alternative to the extract → merge steps: sends both raw documents to
+Gemini in a single call and asks for the already-merged ``MergedData``.
+
+Responsibilities:
+    - Load the merge prompt template
+    - Call the LLM (Google Gemini) in JSON mode with the ``MergedData``
+      schema (reusing cached responses)
+    - Fall back to the split pipeline (paired extraction + Python merger)
+      when the response cannot be parsed or validated
+"""
+
+import functools
+import json
+import logging
+from pathlib import Path
+
+from pydantic import ValidationError
+
+from . import context_cache, llm_cache
+from .extractor import (
+    _call_gemini_extract,
+    _parse_response,
+    extract_structured_data_pair,
+)
+from .merger import MergedData, merge_extractions
+
+logger = logging.getLogger(__name__)
+
+# ---------------------------------------------------------------------------
+# Prompt loader
+# ---------------------------------------------------------------------------
+
+_PROMPT_DIR = Path(__file__).resolve().parent.parent / "prompts"
+
+# First line of the per-request section of the template; everything above
+# it is static and is served from a Gemini context cache.
+_MERGE_REQUEST_MARKER = "=== INSPECTION REPORT TEXT ==="
+
+
+@functools.lru_cache(maxsize=1)
+def _load_merge_prompt() -> str:
+    """Load the one-shot merge prompt template from disk (once per process)."""
+    prompt_path = _PROMPT_DIR / "merge_prompt.txt"
+    if not prompt_path.exists():
+        raise FileNotFoundError(f"Merge prompt not found at {prompt_path}")
+    return prompt_path.read_text(encoding="utf-8")
+
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def extract_and_merge(
+    inspection_text: str,
+    thermal_text: str,
+    model_name: str = "gemini-2.0-flash",
+) -> MergedData:
+    """
+    Extract and merge both reports with a single Gemini call.
+
+    The model does the area matching, deduplication and conflict flagging
+    that ``merge_extractions`` would otherwise do, so the pair needs one
+    call instead of an extraction call plus the Python merge.  If either
+    document is empty, or the response is truncated or not valid
+    ``MergedData``, the split pipeline is used instead.
+
+    Parameters:
+        inspection_text: Raw text of the inspection report.
+        thermal_text:    Raw text of the thermal report.
+        model_name:      The Gemini model name to use.
+
+    Returns:
+        The merged data for both reports.
+    """
+    if not inspection_text.strip() or not thermal_text.strip():
+        return _split_pipeline(inspection_text, thermal_text, model_name)
+
+    static_prefix, request_template = context_cache.split_template(
+        _load_merge_prompt(), _MERGE_REQUEST_MARKER
+    )
+    prompt = request_template.format(
+        inspection_text=inspection_text,
+        thermal_text=thermal_text,
+    )
+
+    cached = llm_cache.get(model_name, "merged_extraction", static_prefix + prompt)
+    if cached is not None:
+        return MergedData.model_validate_json(cached)
+
+    logger.info(
+        "Sending one-shot merge request to %s (inspection_len=%d, thermal_len=%d)",
+        model_name,
+        len(inspection_text),
+        len(thermal_text),
+    )
+
+    raw_content = _call_gemini_extract(
+        model_name, static_prefix, prompt, response_schema=MergedData
+    )
+    try:
+        merged, complete = _parse_response(raw_content, MergedData)
+    except (json.JSONDecodeError, ValidationError) as exc:
+        logger.warning(
+            "One-shot merge response was not valid MergedData (%s); "
+            "falling back to extraction + merge.",
+            exc,
+        )
+        return _split_pipeline(inspection_text, thermal_text, model_name)
+    if not complete:
+        # A truncated merge silently loses whole areas; the split pipeline
+        # asks for less output per call.
+        logger.warning(
+            "One-shot merge response was truncated; falling back to "
+            "extraction + merge."
+        )
+        return _split_pipeline(inspection_text, thermal_text, model_name)
+
+    logger.info(
+        "One-shot merge complete — %d areas, %d conflicts, %d duplicate warnings.",
+        len(merged.areas),
+        merged.conflict_count,
+        len(merged.duplicate_warnings),
+    )
+    llm_cache.put(
+        model_name,
+        "merged_extraction",
+        static_prefix + prompt,
+        merged.model_dump_json(),
+    )
+    return merged
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _split_pipeline(
+    inspection_text: str, thermal_text: str, model_name: str
+) -> MergedData:
+    """Run the regular paired extraction followed by the Python merger."""
+    inspection_data, thermal_data = extract_structured_data_pair(
+        inspection_text, thermal_text, model_name
+    )
+    return merge_extractions(inspection_data, thermal_data)
@@ -7,17 +7,21 @@ to generate the narrative DDR sections.
 Responsibilities:
     - Serialise merged data to a clean string representation
     - Load the reasoning prompt template
-    - Call the LLM for narrative generation
+    - Call the LLM for narrative generation (reusing cached responses),
+      blocking or as a coroutine
     - Return the raw DDR text for formatting
 """
 
-import json
+import asyncio
+import functools
 import logging
 import time
 from pathlib import Path
+from typing import Optional
 
 import google.generativeai as genai
 
+from . import context_cache, gemini_client, llm_cache
 from .merger import MergedData
 
 logger = logging.getLogger(__name__)
@@ -28,9 +32,28 @@ logger = logging.getLogger(__name__)
 
 _PROMPT_DIR = Path(__file__).resolve().parent.parent / "prompts"
 
+# First line of the per-request section of the template; everything above
+# it is static and is served from a Gemini context cache.
+_REASONING_REQUEST_MARKER = "=== MERGED DATA ==="
 
+_MAX_ATTEMPTS = 5
+
+_GENERATION_CONFIG = genai.types.GenerationConfig(
+    temperature=0.2,  # low creativity — stick to the data
+    max_output_tokens=8192,
+)
+
+_SYSTEM_INSTRUCTION = (
+    "You are a senior property diagnostics analyst. "
+    "Produce a clear, client-friendly Detailed Diagnostic "
+    "Report using ONLY the data provided. "
+    "Never invent facts. If data is missing, say 'Not Available'."
+)
+
+
+@functools.lru_cache(maxsize=1)
 def _load_reasoning_prompt() -> str:
-    """Load the reasoning prompt template from disk."""
+    """Load the reasoning prompt template from disk (once per process)."""
     prompt_path = _PROMPT_DIR / "reasoning_prompt.txt"
     if not prompt_path.exists():
         raise FileNotFoundError(f"Reasoning prompt not found at {prompt_path}")
@@ -57,65 +80,125 @@ def generate_ddr_reasoning(
     Returns:
         The raw DDR text produced by the LLM.
     """
-    # Serialise merged data to a readable JSON string
-    merged_json = json.dumps(
-        merged_data.model_dump(),
-        indent=2,
-        ensure_ascii=False,
-    )
+    static_prefix, prompt, merged_len = _build_reasoning_prompt(merged_data)
 
-    # Build the prompt
-    prompt_template = _load_reasoning_prompt()
-    prompt = prompt_template.format(merged_data=merged_json)
+    cached = llm_cache.get(model_name, "ddr_reasoning", static_prefix + prompt)
+    if cached is not None:
+        return cached
 
     logger.info(
         "Sending reasoning request to %s (merged_data_len=%d chars)",
         model_name,
-        len(merged_json),
+        merged_len,
     )
 
     try:
-        # Create the Gemini model with a system instruction for DDR generation
-        model = genai.GenerativeModel(
-            model_name=model_name,
-            system_instruction=(
-                "You are a senior property diagnostics analyst. "
-                "Produce a clear, client-friendly Detailed Diagnostic "
-                "Report using ONLY the data provided. "
-                "Never invent facts. If data is missing, say 'Not Available'."
-            ),
-            generation_config=genai.types.GenerationConfig(
-                temperature=0.2,  # low creativity — stick to the data
-                max_output_tokens=8192,
-            ),
-        )
-
-        # Retry logic for rate-limit (429) errors
         ddr_text = None
-        for attempt in range(1, 4):
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
             try:
-                response = model.generate_content(prompt)
+                response = context_cache.generate_content(
+                    model_name,
+                    _SYSTEM_INSTRUCTION,
+                    static_prefix,
+                    prompt,
+                    _GENERATION_CONFIG,
+                )
                 ddr_text = response.text.strip()
                 break
             except Exception as retry_exc:
-                if "429" in str(retry_exc) and attempt < 3:
-                    wait = 30 * attempt
-                    logger.warning(
-                        "Rate limited (attempt %d/3). Waiting %ds...",
-                        attempt, wait,
-                    )
-                    time.sleep(wait)
-                else:
+                wait = gemini_client.retry_delay(retry_exc, attempt, _MAX_ATTEMPTS)
+                if wait is None:
                     raise
+                time.sleep(wait)
+
+        ddr_text = _check_reasoning_result(ddr_text)
+        llm_cache.put(model_name, "ddr_reasoning", static_prefix + prompt, ddr_text)
+        return ddr_text
+
+    except Exception as exc:
+        logger.error("Reasoning engine failed: %s", exc)
+        raise
+
+
+async def agenerate_ddr_reasoning(
+    merged_data: MergedData,
+    model_name: str = "gemini-2.0-flash",
+) -> str:
+    """
+    Async counterpart of ``generate_ddr_reasoning``.
+
+    Reports for many merged pairs can be generated concurrently with
+    ``asyncio.gather``; requests in flight are capped by
+    ``GEMINI_MAX_CONCURRENCY``.
+    """
+    static_prefix, prompt, merged_len = _build_reasoning_prompt(merged_data)
+
+    cached = await asyncio.to_thread(
+        llm_cache.get, model_name, "ddr_reasoning", static_prefix + prompt
+    )
+    if cached is not None:
+        return cached
+
+    logger.info(
+        "Sending reasoning request to %s (merged_data_len=%d chars)",
+        model_name,
+        merged_len,
+    )
 
-        if ddr_text is None:
-            raise RuntimeError("Failed to get response after retries.")
+    try:
+        ddr_text = None
+        for attempt in range(1, _MAX_ATTEMPTS + 1):
+            try:
+                response = await context_cache.agenerate_content(
+                    model_name,
+                    _SYSTEM_INSTRUCTION,
+                    static_prefix,
+                    prompt,
+                    _GENERATION_CONFIG,
+                )
+                ddr_text = response.text.strip()
+                break
+            except Exception as retry_exc:
+                wait = gemini_client.retry_delay(retry_exc, attempt, _MAX_ATTEMPTS)
+                if wait is None:
+                    raise
+                await asyncio.sleep(wait)
 
-        logger.info(
-            "Reasoning complete — DDR text length: %d chars.", len(ddr_text)
+        ddr_text = _check_reasoning_result(ddr_text)
+        await asyncio.to_thread(
+            llm_cache.put, model_name, "ddr_reasoning", static_prefix + prompt, ddr_text
         )
         return ddr_text
 
     except Exception as exc:
         logger.error("Reasoning engine failed: %s", exc)
         raise
+
+
+# ---------------------------------------------------------------------------
+# Internal helpers
+# ---------------------------------------------------------------------------
+
+
+def _build_reasoning_prompt(merged_data: MergedData) -> tuple[str, str, int]:
+    """Return ``(static_prefix, prompt, merged_json_length)``."""
+    # Serialise merged data to a readable JSON string (straight from the
+    # model in pydantic-core, without building an intermediate dict)
+    merged_json = merged_data.model_dump_json(indent=2)
+
+    static_prefix, request_template = context_cache.split_template(
+        _load_reasoning_prompt(), _REASONING_REQUEST_MARKER
+    )
+    prompt = request_template.format(merged_data=merged_json)
+    return static_prefix, prompt, len(merged_json)
+
+
+def _check_reasoning_result(ddr_text: Optional[str]) -> str:
+    """Raise if no response was obtained; otherwise log and return it."""
+    if ddr_text is None:
+        raise RuntimeError("Failed to get response after retries.")
+
+    logger.info(
+        "Reasoning complete — DDR text length: %d chars.", len(ddr_text)
+    )
+    return ddr_text
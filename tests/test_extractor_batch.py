@@ -0,0 +1,66 @@
+"""Tests for ``src.extractor.extract_structured_data_batch``."""
+
+import asyncio
+import os
+import types
+import unittest
+from unittest import mock
+
+from src import context_cache, extractor
+
+_RESPONSE = '{"areas": [{"area_name": "Hall"}], "global_notes": []}'
+
+
+def _fake_generate_content(*args, **kwargs):
+    return types.SimpleNamespace(text=_RESPONSE)
+
+
+class _LoopBoundClient:
+    """Stands in for the SDK's grpc.aio client, bound to its first loop."""
+
+    def __init__(self):
+        self.loop = None
+
+    async def agenerate_content(self, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        if self.loop is None:
+            self.loop = loop
+        elif self.loop is not loop and self.loop.is_closed():
+            raise RuntimeError("Event loop is closed")
+        return _fake_generate_content()
+
+
+class ExtractBatchTest(unittest.TestCase):
+    def setUp(self):
+        patches = [
+            mock.patch.dict(os.environ, {"DDR_CACHE_ENABLED": "0"}),
+            mock.patch.object(
+                context_cache, "generate_content", _fake_generate_content
+            ),
+            mock.patch.object(
+                context_cache,
+                "agenerate_content",
+                _LoopBoundClient().agenerate_content,
+            ),
+        ]
+        for patch in patches:
+            patch.start()
+            self.addCleanup(patch.stop)
+
+    def test_second_batch_in_same_process(self):
+        documents = [(f"report {i}", "thermal_report") for i in range(3)]
+
+        # The SDK's async client outlives a per-call event loop, so a second
+        # batch used to fail with "Event loop is closed".
+        for _ in range(2):
+            results = extractor.extract_structured_data_batch(documents, "m")
+            self.assertEqual(
+                [r.areas[0].area_name for r in results], ["Hall"] * 3
+            )
+
+    def test_empty_batch(self):
+        self.assertEqual(extractor.extract_structured_data_batch([], "m"), [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,44 @@
+"""Tests for combining chunk extractions in ``src.extractor``."""
+
+import unittest
+
+from src.extractor import AreaExtraction, DocumentExtraction, _combine_extractions
+
+
+class CombineExtractionsTest(unittest.TestCase):
+    def test_repeated_findings_are_kept_once(self):
+        parts = [
+            DocumentExtraction(
+                areas=[
+                    AreaExtraction(
+                        area_name="Hall",
+                        visible_damage=["crack 3.2mm"],
+                        moisture_presence="damp",
+                    )
+                ],
+                global_notes=["occupied"],
+            ),
+            DocumentExtraction(
+                areas=[
+                    AreaExtraction(
+                        area_name="hall",
+                        visible_damage=["crack 3.2mm", "stain"],
+                        moisture_presence="damp",
+                    ),
+                    AreaExtraction(area_name="Roof"),
+                ],
+                global_notes=["occupied"],
+            ),
+        ]
+
+        combined = _combine_extractions(parts)
+
+        self.assertEqual([a.area_name for a in combined.areas], ["Hall", "Roof"])
+        hall = combined.areas[0]
+        self.assertEqual(hall.visible_damage, ["crack 3.2mm", "stain"])
+        self.assertEqual(hall.moisture_presence, "damp")
+        self.assertEqual(combined.global_notes, ["occupied"])
+
+
+if __name__ == "__main__":
+    unittest.main()